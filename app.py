@@ -1,9 +1,8 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory, redirect, url_for, session
+from flask import Flask, request, jsonify, render_template, send_from_directory, redirect, url_for, session, Response, stream_with_context
 from flask_cors import CORS
 import os
 import uuid
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 import requests
 from requests.auth import HTTPBasicAuth
 import json
@@ -11,10 +10,19 @@ import sys
 import logging
 from logging.handlers import RotatingFileHandler
 import traceback
+import threading
+import time
+import hashlib
+from operator import attrgetter
 from dotenv import load_dotenv
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from models import db, NewsPost, AdminUser, AdminRegistryState, ArchivedPost, PostRecord, IST, DATE_FORMAT
+from post_transfer import iter_stored_posts, post_to_ndjson
+from media import IMAGE_VARIANTS, upload_image, apply_image_size
 
 # Load environment variables
 load_dotenv()
@@ -43,6 +51,16 @@ UPLOAD_FOLDER = os.path.join(app.static_folder, 'uploads')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# Database configuration (SQLite on the persistent disk unless DATABASE_URL is set)
+DATA_FOLDER = os.path.join(app.root_path, 'data')
+os.makedirs(DATA_FOLDER, exist_ok=True)
+DATABASE_URL = os.getenv('DATABASE_URL', f"sqlite:///{os.path.join(DATA_FOLDER, 'inbrief.db')}")
+if DATABASE_URL.startswith('postgres://'):
+    DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
+app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
+
 # Configure CORS to allow requests from any origin
 CORS(app, resources={
     r"/*": {
@@ -58,32 +76,365 @@ def after_request(response):
     response.headers.add('Access-Control-Allow-Origin', '*')
     response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,empId,phoneLastFour')
     response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    # Fingerprinted static assets never change under the same URL, but only a
+    # fingerprint matching the current content may be cached forever
+    if request.endpoint == 'static':
+        version = request.args.get('v')
+        if version and version == _asset_versions.get(request.view_args.get('filename')):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
     return response
 
+# Content hashes of static assets, keyed by filename
+_asset_versions = {}
+
+@app.template_global()
+def asset_url(filename):
+    """URL for a static asset, fingerprinted with a hash of its content"""
+    version = _asset_versions.get(filename)
+    if version is None:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            version = hashlib.md5(f.read()).hexdigest()[:12]
+        _asset_versions[filename] = version
+    return url_for('static', filename=filename, v=version)
+
 # SAP API credentials from environment variables
 SAP_API_USERNAME = os.getenv('SAP_API_USERNAME', "api_user@navitasysi")
 SAP_API_PASSWORD = os.getenv('SAP_API_PASSWORD', "api@1234")
 SAP_API_BASE_URL = os.getenv('SAP_API_BASE_URL', "https://api44.sapsf.com/odata/v2")
 
-# Allowed employee IDs for admin access from environment variable
+# Initial admin IDs, used to seed the admin registry on first start
 ALLOWED_ADMIN_IDS_STR = os.getenv('ALLOWED_ADMIN_IDS', '9025857,9025676,9023422')
 ALLOWED_ADMIN_IDS = set(ALLOWED_ADMIN_IDS_STR.split(','))
 
+# Seconds a worker trusts its cached admin set before checking the registry version
+ADMIN_CACHE_TTL = float(os.getenv('ADMIN_CACHE_TTL', '5'))
+
+class AdminRegistry:
+    """Admin IDs stored in the database and cached in memory per worker.
+
+    Each worker keeps the admin set in memory and only re-reads it when the
+    version in admin_registry_state changes. The version itself is checked at
+    most once every ADMIN_CACHE_TTL seconds, so authorization checks do not
+    add a database round trip per request.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._admin_ids = frozenset()
+        self._version = None
+        self._checked_at = 0.0
+
+    def seed(self, emp_ids):
+        """Populate an empty registry with the initial admin IDs"""
+        try:
+            if db.session.get(AdminRegistryState, 1) is None:
+                db.session.add(AdminRegistryState(id=1, version=0))
+                db.session.flush()
+            if AdminUser.query.count() == 0:
+                for emp_id in emp_ids:
+                    if emp_id:
+                        db.session.add(AdminUser(emp_id=emp_id, added_by='system'))
+                self._bump_version()
+            db.session.commit()
+        except Exception as e:
+            # Another worker seeded the registry at the same time
+            db.session.rollback()
+            logger.warning(f"Admin registry seed skipped: {e}")
+
+    def _bump_version(self):
+        AdminRegistryState.query.filter_by(id=1).update(
+            {AdminRegistryState.version: AdminRegistryState.version + 1}
+        )
+
+    def _current_version(self):
+        state = db.session.get(AdminRegistryState, 1)
+        return state.version if state else 0
+
+    def _reload(self, version):
+        ids = frozenset(row.emp_id for row in AdminUser.query.all())
+        self._admin_ids = ids
+        self._version = version
+        self._checked_at = time.monotonic()
+
+    def _refresh(self, force=False):
+        now = time.monotonic()
+        if not force and self._version is not None and now - self._checked_at < self.ttl:
+            return
+        with self._lock:
+            if not force and self._version is not None and now - self._checked_at < self.ttl:
+                return
+            version = self._current_version()
+            if version != self._version:
+                self._reload(version)
+            else:
+                self._checked_at = now
+
+    def is_admin(self, emp_id):
+        self._refresh()
+        return emp_id in self._admin_ids
+
+    def list_admins(self):
+        self._refresh()
+        return sorted(self._admin_ids)
+
+    def add(self, emp_id, added_by=None):
+        """Add an admin. Returns False if the employee is already an admin."""
+        if db.session.get(AdminUser, emp_id) is not None:
+            return False
+        db.session.add(AdminUser(emp_id=emp_id, added_by=added_by))
+        try:
+            self._bump_version()
+            db.session.commit()
+        except IntegrityError:
+            # Another worker added the same admin concurrently
+            db.session.rollback()
+            self._refresh(force=True)
+            return False
+        self._refresh(force=True)
+        return True
+
+    def remove(self, emp_id):
+        """Remove an admin. Returns False if the employee is not an admin."""
+        if AdminUser.query.filter_by(emp_id=emp_id).delete() == 0:
+            db.session.rollback()
+            return False
+        self._bump_version()
+        db.session.commit()
+        self._refresh(force=True)
+        return True
+
+    def add_many(self, emp_ids, added_by=None):
+        """Add several admins in one commit. Returns the IDs that were added."""
+        existing = {row.emp_id for row in AdminUser.query.filter(AdminUser.emp_id.in_(emp_ids))}
+        added = [emp_id for emp_id in emp_ids if emp_id not in existing]
+        if not added:
+            return []
+        db.session.add_all([AdminUser(emp_id=emp_id, added_by=added_by) for emp_id in added])
+        try:
+            self._bump_version()
+            db.session.commit()
+        except IntegrityError:
+            # Another worker added some of these admins concurrently; add the rest one by one
+            db.session.rollback()
+            return [emp_id for emp_id in added if self.add(emp_id, added_by=added_by)]
+        self._refresh(force=True)
+        return added
+
+    def remove_many(self, emp_ids):
+        """Remove several admins in one commit. Returns the IDs that were removed."""
+        existing = {row.emp_id for row in AdminUser.query.filter(AdminUser.emp_id.in_(emp_ids))}
+        removed = [emp_id for emp_id in emp_ids if emp_id in existing]
+        if not removed:
+            return []
+        AdminUser.query.filter(AdminUser.emp_id.in_(removed)).delete(synchronize_session=False)
+        self._bump_version()
+        db.session.commit()
+        self._refresh(force=True)
+        return removed
+
+admin_registry = AdminRegistry(ADMIN_CACHE_TTL)
+
+# Columns added to existing tables after their first release, as (table, column, SQL type)
+SCHEMA_ADDITIONS = [
+    ('news_posts', 'images', 'TEXT'),
+]
+
+def upgrade_schema():
+    """Add missing columns to existing tables; db.create_all() never alters a table"""
+    inspector = inspect(db.engine)
+    for table, column, column_type in SCHEMA_ADDITIONS:
+        existing = {col['name'] for col in inspector.get_columns(table)}
+        if column in existing:
+            continue
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}'))
+            logger.info(f"Added column {table}.{column}")
+        except Exception as e:
+            # Another worker added the column at the same time
+            logger.warning(f"Schema upgrade of {table}.{column} skipped: {e}")
+
+with app.app_context():
+    db.create_all()
+    upgrade_schema()
+    admin_registry.seed(ALLOWED_ADMIN_IDS)
+
+# Employee IDs per batched SAP EmpJob lookup (keeps the OData URL short)
+SAP_LOOKUP_BATCH_SIZE = int(os.getenv('SAP_LOOKUP_BATCH_SIZE', '40'))
+
+# Maximum employee IDs accepted by a single bulk admin request
+MAX_BULK_ADMIN_IDS = 500
+
+# Longest employee ID the admin registry can store
+MAX_EMP_ID_LENGTH = AdminUser.emp_id.type.length
+
 # Post categories
 POST_CATEGORIES = ['Finance', 'Healthcare', 'Achievement', 'Notice', 'Urgent']
 
-# In-memory storage for demo (replace with DB in production)
+# Posts older than this many days move from the live feed to the archive (0 disables)
+POST_RETENTION_DAYS = int(os.getenv('POST_RETENTION_DAYS', '30'))
+
+# Minimum seconds between archive sweeps of the live feed
+ARCHIVE_SWEEP_INTERVAL = int(os.getenv('ARCHIVE_SWEEP_INTERVAL', '300'))
+
+# Page size limits for the archive endpoint
+ARCHIVE_DEFAULT_PAGE_SIZE = 20
+ARCHIVE_MAX_PAGE_SIZE = 100
+
+# Posts can only be edited within this window after creation
+POST_EDIT_WINDOW_SECONDS = 2 * 60 * 60
+
+# Live feed as PostRecord objects, loaded from and written through to NewsPost
 news_posts = []
 
+# Guards structural changes (insert/remove) to news_posts across request threads
+_posts_lock = threading.Lock()
+
+# time.monotonic() of the last archive sweep
+_last_archive_sweep = None
+
+# Posts embedded in the dashboard page so it renders without a second request
+DASHBOARD_FIRST_PAGE_SIZE = 20
+
+# Live feed as sorted post dicts, rebuilt lazily after any change to news_posts
+_feed_snapshot = None
+
+# Bumped on every invalidation so a snapshot built from an older feed is never stored
+_feed_generation = 0
+_feed_lock = threading.Lock()
+
 def generate_post_id():
     return str(uuid.uuid4())
 
-def is_post_editable(post_date):
+def is_post_editable(post):
     """Check if post is within 2 hour edit window"""
-    ist = ZoneInfo('Asia/Kolkata')
-    post_time = datetime.strptime(post_date, '%Y-%m-%d %H:%M:%S').replace(tzinfo=ist)
-    current_time = datetime.now(ist)
-    return current_time - post_time <= timedelta(hours=2)
+    return time.time() - post.timestamp <= POST_EDIT_WINDOW_SECONDS
+
+def archive_old_posts():
+    """Move posts past the retention window from the live feed to the archive table"""
+    if POST_RETENTION_DAYS <= 0:
+        return 0
+    cutoff = time.time() - POST_RETENTION_DAYS * 24 * 60 * 60
+    expired = [post for post in news_posts if post.timestamp < cutoff]
+    if not expired:
+        return 0
+    expired_ids = {post.id for post in expired}
+    try:
+        for post in expired:
+            db.session.merge(ArchivedPost.from_dict(post.to_dict()))
+        NewsPost.query.filter(NewsPost.id.in_(expired_ids)).delete(synchronize_session=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error archiving posts: {e}")
+        return 0
+    remove_live_posts(expired_ids)
+    logger.info(f"Archived {len(expired)} posts older than {POST_RETENTION_DAYS} days")
+    return len(expired)
+
+def remove_live_posts(post_ids):
+    """Remove posts from the live feed in place, leaving concurrent inserts intact"""
+    with _posts_lock:
+        for i in range(len(news_posts) - 1, -1, -1):
+            if news_posts[i].id in post_ids:
+                del news_posts[i]
+    invalidate_feed_snapshot()
+
+def replace_live_post(post):
+    """Swap the live feed entry with post's id for post"""
+    with _posts_lock:
+        for i, live_post in enumerate(news_posts):
+            if live_post.id == post.id:
+                news_posts[i] = post
+                break
+    invalidate_feed_snapshot()
+
+def save_post(post):
+    """Write a live post through to the NewsPost table"""
+    try:
+        db.session.merge(NewsPost.from_dict(post.to_dict()))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+def load_stored_posts(batch_size=1000):
+    """Load NewsPost rows into the live feed, archiving rows past the retention window.
+
+    Runs at startup, so posts restored with post_transfer.py or
+    migrate_to_database.py appear in the feed after the next restart.
+    """
+    if POST_RETENTION_DAYS > 0:
+        cutoff = (datetime.now(IST) - timedelta(days=POST_RETENTION_DAYS)).strftime(DATE_FORMAT)
+        while True:
+            expired = NewsPost.query.filter(NewsPost.date < cutoff).limit(batch_size).all()
+            if not expired:
+                break
+            for row in expired:
+                db.session.merge(ArchivedPost.from_dict(row.to_dict()))
+                db.session.delete(row)
+            db.session.commit()
+            db.session.expunge_all()
+            logger.info(f"Archived {len(expired)} stored posts older than {POST_RETENTION_DAYS} days")
+    records = []
+    for row in NewsPost.query.yield_per(batch_size):
+        try:
+            records.append(PostRecord.from_dict(row.to_dict()))
+        except (TypeError, ValueError) as e:
+            logger.error(f"Skipping stored post {row.id}: {e}")
+    with _posts_lock:
+        news_posts[:] = records
+    invalidate_feed_snapshot()
+    logger.info(f"Loaded {len(records)} stored posts into the live feed")
+
+def invalidate_feed_snapshot():
+    global _feed_snapshot, _feed_generation
+    with _feed_lock:
+        _feed_generation += 1
+        _feed_snapshot = None
+
+def get_feed_snapshot():
+    """Return the live feed as post dicts, newest first. Callers must not mutate it."""
+    global _feed_snapshot
+    maybe_archive_old_posts()
+    snapshot = _feed_snapshot
+    if snapshot is None:
+        generation = _feed_generation
+        # Sort by timestamp (descending)
+        snapshot = [post.to_dict() for post in sorted(news_posts, key=attrgetter('timestamp'), reverse=True)]
+        with _feed_lock:
+            # Only cache it if no write invalidated the feed while it was being built
+            if generation == _feed_generation:
+                _feed_snapshot = snapshot
+    return snapshot
+
+def maybe_archive_old_posts():
+    """Run archive_old_posts at most once every ARCHIVE_SWEEP_INTERVAL seconds"""
+    global _last_archive_sweep
+    now = time.monotonic()
+    if _last_archive_sweep is not None and now - _last_archive_sweep < ARCHIVE_SWEEP_INTERVAL:
+        return
+    _last_archive_sweep = now
+    archive_old_posts()
+
+with app.app_context():
+    load_stored_posts()
+
+def delete_cloudinary_images(images):
+    """Remove a post's images from Cloudinary, logging any failures"""
+    for image in images:
+        if not isinstance(image, dict):
+            continue
+        public_id = image.get('public_id')
+        url = image.get('url')
+        if isinstance(public_id, str) and public_id and isinstance(url, str) and 'cloudinary.com' in url:
+            try:
+                # Delete from Cloudinary
+                result = cloudinary.uploader.destroy(public_id)
+                logger.info(f"Deleted image from Cloudinary: {public_id}")
+            except Exception as e:
+                logger.error(f"Error deleting image from Cloudinary: {e}")
 
 # Add back the mobile app verification endpoint
 @app.route('/api/verify_employee', methods=['GET'])
@@ -217,7 +568,7 @@ def login():
         if not emp_id or not phone_last_four:
             return render_template('login.html', error='Employee ID and password are required')
             
-        if emp_id not in ALLOWED_ADMIN_IDS:
+        if not admin_registry.is_admin(emp_id):
             return render_template('login.html', error='Unauthorized access')
             
         try:
@@ -295,6 +646,10 @@ def login_required(f):
     def decorated_function(*args, **kwargs):
         if not session.get('logged_in'):
             return redirect(url_for('login'))
+        # Admin access may have been revoked since login
+        if not admin_registry.is_admin(session.get('employee_id')):
+            session.clear()
+            return redirect(url_for('login'))
         return f(*args, **kwargs)
     decorated_function.__name__ = f.__name__
     return decorated_function
@@ -303,17 +658,76 @@ def login_required(f):
 @app.route('/')
 @login_required
 def dashboard():
+    feed = get_feed_snapshot()
     return render_template('dashboard.html',
                          employee_name=session.get('employee_name'),
-                         categories=POST_CATEGORIES)
+                         categories=POST_CATEGORIES,
+                         initial_feed={
+                             'posts': feed[:DASHBOARD_FIRST_PAGE_SIZE],
+                             'has_more': len(feed) > DASHBOARD_FIRST_PAGE_SIZE
+                         })
 
 # List all posts
 @app.route('/api/news/all', methods=['GET'])
 def get_all_news():
-    all_posts = [post.copy() for post in news_posts]
-    # Sort by date (descending)
-    all_posts.sort(key=lambda x: x.get('date', ''), reverse=True)
-    return jsonify(all_posts)
+    # Optional image variant (thumbnail, card, full) to serve in image_urls
+    image_size = request.args.get('image_size')
+    if image_size and image_size not in IMAGE_VARIANTS:
+        return jsonify({'error': 'Invalid image size'}), 400
+    feed = get_feed_snapshot()
+    if image_size:
+        return jsonify([apply_image_size(dict(post), image_size) for post in feed])
+    return jsonify(feed)
+
+# List archived posts, one page at a time
+@app.route('/api/news/archive', methods=['GET'])
+def get_archived_news():
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', ARCHIVE_DEFAULT_PAGE_SIZE, type=int)
+    image_size = request.args.get('image_size')
+    if page < 1 or per_page < 1:
+        return jsonify({'error': 'page and per_page must be positive integers'}), 400
+    if image_size and image_size not in IMAGE_VARIANTS:
+        return jsonify({'error': 'Invalid image size'}), 400
+    per_page = min(per_page, ARCHIVE_MAX_PAGE_SIZE)
+
+    try:
+        maybe_archive_old_posts()
+        # Fetch one extra row to know whether another page exists
+        rows = (ArchivedPost.query
+                .order_by(ArchivedPost.date.desc(), ArchivedPost.id)
+                .offset((page - 1) * per_page)
+                .limit(per_page + 1)
+                .all())
+        return jsonify({
+            'posts': [apply_image_size(row.to_dict(), image_size) for row in rows[:per_page]],
+            'page': page,
+            'per_page': per_page,
+            'has_more': len(rows) > per_page
+        })
+    except Exception as e:
+        logger.error(f"Error getting archived posts: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+# Stream every post (live feed, stored and archived) as NDJSON for backups
+@app.route('/api/news/export', methods=['GET'])
+@login_required
+def export_news():
+    live_posts = [post.to_dict() for post in news_posts]
+    live_ids = {post['id'] for post in live_posts}
+
+    def generate():
+        for post in live_posts:
+            yield post_to_ndjson(post)
+        for post in iter_stored_posts(skip_ids=live_ids):
+            yield post_to_ndjson(post)
+
+    filename = f"inbrief-posts-{datetime.now().strftime('%Y%m%d-%H%M%S')}.ndjson"
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
 
 # Add a new post
 @app.route('/api/news', methods=['POST'])
@@ -331,50 +745,44 @@ def add_news():
     if category and category not in POST_CATEGORIES:
         return jsonify({'error': 'Invalid category'}), 400
         
-    image_urls = []
+    uploaded_images = []
     if images:
         for image in images:
             if image:
                 try:
-                    # Upload to Cloudinary with your specific configuration
-                    result = cloudinary.uploader.upload(
-                        image,
-                        public_id=f"test/image/{uuid.uuid4()}",  # Use your asset folder path
-                        folder="test/image",  # Your configured asset folder
-                        resource_type="auto",
-                        upload_preset="inbrief_app"  # Your upload preset
-                    )
-                    # Get the secure URL from Cloudinary
-                    cloudinary_url = result['secure_url']
-                    image_urls.append(cloudinary_url)
-                    logger.info(f"Image uploaded to Cloudinary: {cloudinary_url}")
+                    # Record dimensions, size and variant URLs at upload time
+                    uploaded_images.append(upload_image(image))
                 except Exception as e:
                     logger.error(f"Error uploading image to Cloudinary: {e}")
                     return jsonify({'error': 'Failed to upload image'}), 500
                 
     post_id = generate_post_id()
-    ist = ZoneInfo('Asia/Kolkata')
-    date_str = datetime.now(ist).strftime('%Y-%m-%d %H:%M:%S')
-    news_item = {
-        'id': post_id,
-        'headline': headline,
-        'description': description,
-        'image_urls': image_urls,
-        'date': date_str,
-        'category': category,  # Only stored in backend, not sent to mobile app
-        'author': session.get('employee_name')
-    }
-    news_posts.insert(0, news_item)
-    return jsonify({'success': True, 'item': news_item}), 201
+    news_item = PostRecord.create(
+        id=post_id,
+        headline=headline,
+        description=description,
+        images=uploaded_images,
+        category=category,  # Only stored in backend, not sent to mobile app
+        author=session.get('employee_name')
+    )
+    try:
+        save_post(news_item)
+    except Exception as e:
+        logger.error(f"Error saving post: {e}")
+        return jsonify({'error': 'Failed to save post'}), 500
+    with _posts_lock:
+        news_posts.insert(0, news_item)
+    invalidate_feed_snapshot()
+    return jsonify({'success': True, 'item': news_item.to_dict()}), 201
 
 # Edit a post by id
 @app.route('/api/news/edit/<post_id>', methods=['POST'])
 @login_required
 def edit_news(post_id):
     for post in news_posts:
-        if post['id'] == post_id:
+        if post.id == post_id:
             # Check if post is older than 2 hours
-            if not is_post_editable(post['date']):
+            if not is_post_editable(post):
                 return jsonify({'error': 'Posts can only be edited within 2 hours of creation'}), 403
                 
             headline = request.form.get('headline', '')
@@ -389,34 +797,34 @@ def edit_news(post_id):
             if category and category not in POST_CATEGORIES:
                 return jsonify({'error': 'Invalid category'}), 400
                 
-            post['headline'] = headline
-            post['description'] = description
-            if category:
-                post['category'] = category
-                
+            # Upload new images before changing the post so a failed upload leaves it intact
+            uploaded_images = []
             if images and len(images) > 0:
-                image_urls = []
                 for image in images:
                     if image:
                         try:
-                            # Upload to Cloudinary with your specific configuration
-                            result = cloudinary.uploader.upload(
-                                image,
-                                public_id=f"test/image/{uuid.uuid4()}",  # Use your asset folder path
-                                folder="test/image",  # Your configured asset folder
-                                resource_type="auto",
-                                upload_preset="inbrief_app"  # Your upload preset
-                            )
-                            # Get the secure URL from Cloudinary
-                            cloudinary_url = result['secure_url']
-                            image_urls.append(cloudinary_url)
-                            logger.info(f"Image uploaded to Cloudinary: {cloudinary_url}")
+                            # Record dimensions, size and variant URLs at upload time
+                            uploaded_images.append(upload_image(image))
                         except Exception as e:
                             logger.error(f"Error uploading image to Cloudinary: {e}")
                             return jsonify({'error': 'Failed to upload image'}), 500
-                post['image_urls'] = image_urls
                 
-            return jsonify({'success': True, 'item': post}), 200
+            changes = {'headline': headline, 'description': description}
+            if category:
+                changes['category'] = category
+            if uploaded_images:
+                changes['images'] = tuple(uploaded_images)
+                changes['image_urls'] = tuple(image['url'] for image in uploaded_images)
+            # Save an edited copy so the live post only changes once the write succeeds
+            updated = post.replace(**changes)
+            try:
+                save_post(updated)
+            except Exception as e:
+                logger.error(f"Error saving post: {e}")
+                return jsonify({'error': 'Failed to save post'}), 500
+            replace_live_post(updated)
+                
+            return jsonify({'success': True, 'item': updated.to_dict()}), 200
             
     return jsonify({'error': 'Post not found'}), 404
 
@@ -424,27 +832,33 @@ def edit_news(post_id):
 @app.route('/api/news/delete/<post_id>', methods=['DELETE'])
 @login_required
 def delete_news(post_id):
-    for i, post in enumerate(news_posts):
-        if post['id'] == post_id:
-            # Remove images from Cloudinary if present
-            image_urls = post.get('image_urls', [])
-            for url in image_urls:
-                if url and 'cloudinary.com' in url:
-                    try:
-                        # Extract public_id from Cloudinary URL
-                        # URL format: https://res.cloudinary.com/dttnc46ds/image/upload/v1234567890/test/image/uuid.jpg
-                        parts = url.split('/')
-                        if len(parts) >= 8:
-                            public_id = '/'.join(parts[7:])  # Get the part after 'upload/'
-                            # Remove file extension
-                            public_id = public_id.rsplit('.', 1)[0]
-                            # Delete from Cloudinary
-                            result = cloudinary.uploader.destroy(public_id)
-                            logger.info(f"Deleted image from Cloudinary: {public_id}")
-                    except Exception as e:
-                        logger.error(f"Error deleting image from Cloudinary: {e}")
-            news_posts.pop(i)
-            return jsonify({'success': True}), 200
+    for post in news_posts:
+        if post.id == post_id:
+            try:
+                NewsPost.query.filter_by(id=post_id).delete()
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error deleting post: {e}")
+                return jsonify({'error': 'Failed to delete post'}), 500
+            remove_live_posts({post_id})
+            # Remove images from Cloudinary only once the post is gone
+            delete_cloudinary_images(post.images)
+            return jsonify({'success': True, 'id': post_id}), 200
+
+    # Fall back to the archive for posts past the retention window
+    archived = db.session.get(ArchivedPost, post_id)
+    if archived is not None:
+        images = PostRecord.from_dict(archived.to_dict()).images
+        try:
+            db.session.delete(archived)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error deleting archived post: {e}")
+            return jsonify({'error': 'Failed to delete post'}), 500
+        delete_cloudinary_images(images)
+        return jsonify({'success': True, 'id': post_id}), 200
     return jsonify({'error': 'Post not found'}), 404
 
 @app.route('/static/uploads/<filename>')
@@ -463,7 +877,7 @@ def assign_admin():
 
     try:
         # Verify the requesting user is an admin
-        if session.get('employee_id') not in ALLOWED_ADMIN_IDS:
+        if not admin_registry.is_admin(session.get('employee_id')):
             return jsonify({'error': 'Unauthorized to assign admin access'}), 403
 
         # Verify the employee exists in SAP before assigning admin
@@ -487,8 +901,8 @@ def assign_admin():
         if not results:
             return jsonify({'error': 'Employee not found'}), 404
 
-        # Add the new admin to ALLOWED_ADMIN_IDS
-        ALLOWED_ADMIN_IDS.add(emp_id)
+        # Add the new admin to the registry
+        admin_registry.add(emp_id, added_by=session.get('employee_id'))
         logger.info(f"Admin access granted to Employee ID: {emp_id} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         return jsonify({'success': True})
     except requests.Timeout:
@@ -502,12 +916,111 @@ def assign_admin():
         logger.error(traceback.format_exc())
         return jsonify({'error': 'Internal server error'}), 500
 
+def find_existing_employees(emp_ids):
+    """Return the subset of emp_ids that exist in SAP, using batched EmpJob queries"""
+    found = set()
+    for start in range(0, len(emp_ids), SAP_LOOKUP_BATCH_SIZE):
+        batch = emp_ids[start:start + SAP_LOOKUP_BATCH_SIZE]
+        id_filter = ' or '.join(f"userId eq '{emp_id}'" for emp_id in batch)
+        query = (
+            f"{SAP_API_BASE_URL}/EmpJob?$filter={id_filter}"
+            "&$select=userId"
+            f"&$top={len(batch) * 10}"
+            "&$format=json"
+        )
+        response = requests.get(
+            query,
+            auth=HTTPBasicAuth(SAP_API_USERNAME, SAP_API_PASSWORD),
+            timeout=30
+        )
+        if response.status_code != 200:
+            logger.error(f"SAP API request failed with status {response.status_code}")
+            raise requests.RequestException(f"SAP API returned {response.status_code}")
+        results = response.json().get('d', {}).get('results', [])
+        found.update(result.get('userId') for result in results)
+    return found
+
+# Assign or remove admin access for many employees at once
+@app.route('/api/admin/bulk', methods=['POST'])
+@login_required
+def bulk_admin():
+    data = request.get_json(silent=True) or {}
+    action = data.get('action')
+    emp_ids = data.get('empIds')
+
+    if action not in ('assign', 'remove'):
+        return jsonify({'error': "Action must be 'assign' or 'remove'"}), 400
+    if not isinstance(emp_ids, list) or not emp_ids:
+        return jsonify({'error': 'A list of employee IDs is required'}), 400
+    if len(emp_ids) > MAX_BULK_ADMIN_IDS:
+        return jsonify({'error': f'At most {MAX_BULK_ADMIN_IDS} employee IDs per request'}), 400
+
+    try:
+        # Verify the requesting user is an admin
+        current_id = session.get('employee_id')
+        if not admin_registry.is_admin(current_id):
+            return jsonify({'error': f'Unauthorized to {action} admin access'}), 403
+
+        # Normalise input, keeping the first occurrence of each ID
+        statuses = {}
+        invalid_values = []
+        candidates = []
+        for raw_id in emp_ids:
+            # Only strings and integers are IDs (bool is an int subclass, so exclude it)
+            if isinstance(raw_id, bool) or not isinstance(raw_id, (str, int)):
+                invalid_values.append(raw_id)
+                continue
+            emp_id = str(raw_id).strip()
+            if emp_id in statuses:
+                continue
+            if not emp_id.isalnum() or len(emp_id) > MAX_EMP_ID_LENGTH:
+                statuses[emp_id] = 'invalid'
+            elif action == 'remove' and emp_id == current_id:
+                statuses[emp_id] = 'cannot_remove_self'
+            else:
+                statuses[emp_id] = None
+                candidates.append(emp_id)
+
+        if action == 'assign':
+            # Verify all employees exist in SAP before assigning admin
+            existing = find_existing_employees(candidates) if candidates else set()
+            for emp_id in candidates:
+                if emp_id not in existing:
+                    statuses[emp_id] = 'not_found'
+            valid = [emp_id for emp_id in candidates if statuses[emp_id] is None]
+            changed = set(admin_registry.add_many(valid, added_by=current_id))
+            for emp_id in valid:
+                statuses[emp_id] = 'added' if emp_id in changed else 'already_admin'
+        else:
+            changed = set(admin_registry.remove_many(candidates))
+            for emp_id in candidates:
+                statuses[emp_id] = 'removed' if emp_id in changed else 'not_admin'
+
+        logger.info(f"Bulk admin {action} by {current_id}: {len(changed)} changed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return jsonify({
+            'success': True,
+            'changed': len(changed),
+            'results': [{'empId': emp_id, 'status': status} for emp_id, status in statuses.items()]
+                       + [{'empId': value, 'status': 'invalid'} for value in invalid_values]
+        })
+    except requests.Timeout:
+        logger.error("SAP API request timed out")
+        return jsonify({'error': 'Request timed out'}), 408
+    except requests.RequestException as e:
+        logger.error(f"SAP API request failed: {e}")
+        return jsonify({'error': 'Failed to connect to SAP API'}), 500
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error in bulk admin update: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({'error': 'Internal server error'}), 500
+
 # Get admin list
 @app.route('/api/admin/list', methods=['GET'])
 @login_required
 def get_admin_list():
     try:
-        return jsonify({'admins': list(ALLOWED_ADMIN_IDS)})
+        return jsonify({'admins': admin_registry.list_admins()})
     except Exception as e:
         logger.error(f"Error getting admin list: {e}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -524,16 +1037,15 @@ def remove_admin():
 
     try:
         # Verify the requesting user is an admin
-        if session.get('employee_id') not in ALLOWED_ADMIN_IDS:
+        if not admin_registry.is_admin(session.get('employee_id')):
             return jsonify({'error': 'Unauthorized to remove admin access'}), 403
 
         # Prevent removing yourself
         if emp_id == session.get('employee_id'):
             return jsonify({'error': 'Cannot remove your own admin access'}), 400
 
-        # Remove from ALLOWED_ADMIN_IDS
-        if emp_id in ALLOWED_ADMIN_IDS:
-            ALLOWED_ADMIN_IDS.remove(emp_id)
+        # Remove from the admin registry
+        if admin_registry.remove(emp_id):
             logger.info(f"Admin access removed from Employee ID: {emp_id} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             return jsonify({'success': True})
         else:
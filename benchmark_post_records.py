@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark dict posts against PostRecord for memory, feed sorting and edit checks
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import gc
+import json
+import time
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+from operator import attrgetter
+from zoneinfo import ZoneInfo
+
+from media import IMAGE_VARIANTS
+from models import PostRecord, DATE_FORMAT
+
+POST_COUNT = 100_000
+
+# Every IMAGE_POST_EVERY-th post carries an uploaded image with its metadata
+IMAGE_POST_EVERY = 3
+
+def make_image(public_id):
+    """Build image metadata shaped like media.upload_image output"""
+    prefix = 'https://res.cloudinary.com/demo/image/upload'
+    return {
+        'public_id': public_id,
+        'url': f'{prefix}/v1700000000/{public_id}.jpg',
+        'width': 1920,
+        'height': 1080,
+        'bytes': 350000,
+        'format': 'jpg',
+        'variants': {name: f'{prefix}/t_{name}/v1700000000/{public_id}.jpg' for name in IMAGE_VARIANTS}
+    }
+
+def make_post_lines(count):
+    """Build posts in the NewsPost.to_dict format, JSON encoded as rows are stored"""
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    lines = []
+    for i in range(count):
+        images = []
+        if i % IMAGE_POST_EVERY == 0:
+            images.append(make_image(f'test/image/{i:08d}'))
+        lines.append(json.dumps({
+            'id': f'{i:08d}-0000-4000-8000-000000000000',
+            'headline': f'Post {i}',
+            'description': 'Lorem ipsum',
+            'image_urls': [image['url'] for image in images],
+            'images': images,
+            'date': (start + timedelta(seconds=rng.randrange(10**8))).strftime(DATE_FORMAT),
+            'category': 'Notice',
+            'author': 'Benchmark'
+        }))
+    return lines
+
+def measure_memory(build):
+    """Return (result, bytes allocated) for build()"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+def timed(func, repeat=3):
+    """Return the best wall time of func over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def old_is_post_editable(post_date):
+    """The original per-call strptime + ZoneInfo edit window check"""
+    ist = ZoneInfo('Asia/Kolkata')
+    post_time = datetime.strptime(post_date, DATE_FORMAT).replace(tzinfo=ist)
+    current_time = datetime.now(ist)
+    return current_time - post_time <= timedelta(hours=2)
+
+def new_is_post_editable(post):
+    return time.time() - post.timestamp <= 2 * 60 * 60
+
+def run_benchmark(count=POST_COUNT):
+    print(f"📊 Benchmarking {count} posts...")
+
+    lines = make_post_lines(count)
+    # Decode each side separately so both own their image metadata dicts
+    dict_posts, dict_bytes = measure_memory(lambda: [json.loads(line) for line in lines])
+    records, record_bytes = measure_memory(lambda: [PostRecord.from_dict(json.loads(line)) for line in lines])
+    print(f"\n💾 Resident memory (1 in {IMAGE_POST_EVERY} posts with an image)")
+    print(f"   dict posts:   {dict_bytes / 1024 / 1024:8.1f} MiB ({dict_bytes / count:.0f} B/post)")
+    print(f"   PostRecord:   {record_bytes / 1024 / 1024:8.1f} MiB ({record_bytes / count:.0f} B/post)")
+    print(f"   saving:       {(1 - record_bytes / dict_bytes) * 100:8.1f}%")
+
+    # Each side does what its get_all_news does before jsonify: copy/convert and sort
+    def dict_feed():
+        all_posts = [post.copy() for post in dict_posts]
+        all_posts.sort(key=lambda x: x.get('date', ''), reverse=True)
+        return all_posts
+
+    def record_feed():
+        return [post.to_dict() for post in sorted(records, key=attrgetter('timestamp'), reverse=True)]
+
+    dict_sort_only = timed(lambda: sorted(dict_posts, key=lambda x: x.get('date', ''), reverse=True))
+    record_sort_only = timed(lambda: sorted(records, key=attrgetter('timestamp'), reverse=True))
+    dict_build = timed(dict_feed)
+    record_build = timed(record_feed)
+    print(f"\n📰 Feed build (sort + per-post copy/to_dict, as in get_all_news)")
+    print(f"   dict posts:   {dict_build * 1000:8.1f} ms (sort alone {dict_sort_only * 1000:.1f} ms)")
+    print(f"   PostRecord:   {record_build * 1000:8.1f} ms (sort alone {record_sort_only * 1000:.1f} ms)")
+
+    dict_edit = timed(lambda: [old_is_post_editable(post['date']) for post in dict_posts])
+    record_edit = timed(lambda: [new_is_post_editable(post) for post in records])
+    print(f"\n✏️  Edit window check (all posts)")
+    print(f"   dict posts:   {dict_edit * 1000:8.1f} ms ({dict_edit / count * 1e6:.2f} µs/post)")
+    print(f"   PostRecord:   {record_edit * 1000:8.1f} ms ({record_edit / count * 1e6:.2f} µs/post)")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else POST_COUNT)
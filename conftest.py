@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures: a throwaway database and a clean app state per test
+"""
+
+import os
+import tempfile
+
+# Use a throwaway database before the app is imported
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+
+import pytest
+
+import app as inbrief
+from models import db, NewsPost, ArchivedPost, AdminUser
+
+ADMIN_ID = sorted(inbrief.ALLOWED_ADMIN_IDS)[0]
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Empty the post tables and live feed and reseed the admin registry"""
+    with inbrief.app.app_context():
+        NewsPost.query.delete()
+        ArchivedPost.query.delete()
+        AdminUser.query.delete()
+        db.session.commit()
+        inbrief.admin_registry.seed(inbrief.ALLOWED_ADMIN_IDS)
+        inbrief.admin_registry._refresh(force=True)
+    inbrief.news_posts.clear()
+    inbrief.invalidate_feed_snapshot()
+    inbrief._last_archive_sweep = None
+    yield
+
+@pytest.fixture
+def app_context():
+    with inbrief.app.app_context():
+        yield
+
+@pytest.fixture
+def client():
+    return inbrief.app.test_client()
+
+@pytest.fixture
+def admin_client(client):
+    """Test client with a logged-in admin session"""
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+        sess['employee_id'] = ADMIN_ID
+        sess['employee_name'] = 'Test Admin'
+    return client
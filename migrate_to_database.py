@@ -7,11 +7,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app, db
+from app import app, db, POST_CATEGORIES
 from models import NewsPost
+from post_transfer import import_posts
 import json
 
-def migrate_data():
+def migrate_data(ndjson_path=None):
     """Migrate existing data to database"""
     with app.app_context():
         print("🔄 Starting database migration...")
@@ -20,6 +21,17 @@ def migrate_data():
         db.create_all()
         print("✅ Database tables created")
         
+        # Bulk import an NDJSON export when one is given
+        if ndjson_path:
+            print(f"📥 Importing posts from {ndjson_path}...")
+            with open(ndjson_path, encoding='utf-8') as source:
+                report = import_posts(source, POST_CATEGORIES)
+            print(f"✅ Imported {report['imported']} posts "
+                  f"({report['skipped']} skipped, {report['invalid']} invalid)")
+            for error in report['errors']:
+                print(f"   ❌ {error}")
+            return
+        
         # Check if there's any existing data to migrate
         existing_posts = NewsPost.query.count()
         if existing_posts > 0:
@@ -75,9 +87,11 @@ def verify_database():
     with app.app_context():
         print("\n🔍 Verifying database...")
         
-        posts = NewsPost.query.all()
-        print(f"📝 Found {len(posts)} posts in database")
+        total_posts = NewsPost.query.count()
+        print(f"📝 Found {total_posts} posts in database")
         
+        # Only list the first few posts so large imports stay readable
+        posts = NewsPost.query.order_by(NewsPost.date.desc()).limit(20).all()
         for i, post in enumerate(posts):
             print(f"  {i+1}. {post.headline} (ID: {post.id})")
             print(f"     Author: {post.author}")
@@ -87,7 +101,7 @@ def verify_database():
 
 if __name__ == "__main__":
     try:
-        migrate_data()
+        migrate_data(sys.argv[1] if len(sys.argv) > 1 else None)
         verify_database()
         print("\n🎉 Migration completed successfully!")
         print("💡 Your posts will now persist across server restarts!")
@@ -1,9 +1,77 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from zoneinfo import ZoneInfo
 import json
+import zlib
+from media import normalize_images
 
 db = SQLAlchemy()
 
+# Posts are dated in India time; create the zone once rather than per call
+IST = ZoneInfo('Asia/Kolkata')
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class PostRecord:
+    """Compact in-memory post with a pre-parsed epoch timestamp.
+
+    Stores the same fields as NewsPost.to_dict plus the post time as epoch
+    seconds, so feed sorting and edit-window checks never parse dates.
+    images holds per-image metadata and variant URLs (see media.upload_image).
+    image_urls and images are tuples that to_dict shares rather than copies,
+    so records must be changed with replace() instead of in place.
+    """
+    __slots__ = ('id', 'headline', 'description', 'image_urls', 'images', 'date',
+                 'timestamp', 'category', 'author')
+
+    def __init__(self, id, headline, description, image_urls, images, date, timestamp, category, author):
+        self.id = id
+        self.headline = headline
+        self.description = description
+        self.image_urls = image_urls
+        self.images = images
+        self.date = date
+        self.timestamp = timestamp
+        self.category = category
+        self.author = author
+
+    @classmethod
+    def create(cls, id, headline, description, images, category, author):
+        """Create a record dated now (IST) from uploaded image metadata"""
+        now = datetime.now(IST)
+        return cls(id, headline, description, tuple(image['url'] for image in images),
+                   tuple(images), now.strftime(DATE_FORMAT), int(now.timestamp()), category, author)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a record from the NewsPost.to_dict format"""
+        date = data.get('date')
+        timestamp = int(datetime.strptime(date, DATE_FORMAT).replace(tzinfo=IST).timestamp())
+        image_urls = tuple(data.get('image_urls') or ())
+        # Posts stored before upload-time metadata, or with malformed metadata,
+        # get variants derived from their URLs
+        images = tuple(normalize_images(data.get('images'), image_urls))
+        return cls(data.get('id'), data.get('headline') or '', data.get('description') or '',
+                   image_urls, images, date, timestamp, data.get('category'), data.get('author'))
+
+    def replace(self, **changes):
+        """Return a copy of this record with the given fields changed"""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return PostRecord(**fields)
+
+    def to_dict(self):
+        """Convert to the NewsPost.to_dict format"""
+        return {
+            'id': self.id,
+            'headline': self.headline,
+            'description': self.description,
+            'image_urls': self.image_urls,
+            'images': self.images,
+            'date': self.date,
+            'category': self.category,
+            'author': self.author
+        }
+
 class NewsPost(db.Model):
     __tablename__ = 'news_posts'
     
@@ -11,6 +79,7 @@ class NewsPost(db.Model):
     headline = db.Column(db.String(500))
     description = db.Column(db.Text)
     image_urls = db.Column(db.Text)  # JSON string
+    images = db.Column(db.Text)  # JSON string of per-image metadata and variant URLs
     date = db.Column(db.String(20))
     category = db.Column(db.String(50))
     author = db.Column(db.String(100))
@@ -23,6 +92,7 @@ class NewsPost(db.Model):
             'headline': self.headline or '',
             'description': self.description or '',
             'image_urls': json.loads(self.image_urls) if self.image_urls else [],
+            'images': json.loads(self.images) if self.images else [],
             'date': self.date,
             'category': self.category,
             'author': self.author
@@ -36,7 +106,45 @@ class NewsPost(db.Model):
             headline=data.get('headline', ''),
             description=data.get('description', ''),
             image_urls=json.dumps(data.get('image_urls', [])),
+            images=json.dumps(data.get('images', [])),
             date=data.get('date'),
             category=data.get('category'),
             author=data.get('author', '')
         )
+
+class AdminUser(db.Model):
+    __tablename__ = 'admin_users'
+    
+    emp_id = db.Column(db.String(20), primary_key=True)
+    added_by = db.Column(db.String(20))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class AdminRegistryState(db.Model):
+    """Single-row table whose version is bumped on every admin change"""
+    __tablename__ = 'admin_registry_state'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class ArchivedPost(db.Model):
+    """Cold storage for posts past the retention window"""
+    __tablename__ = 'archived_posts'
+    
+    id = db.Column(db.String(36), primary_key=True)
+    date = db.Column(db.String(20), index=True)
+    payload = db.Column(db.LargeBinary)  # zlib-compressed JSON of the post dict
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def to_dict(self):
+        """Decompress the archived post back to dictionary format"""
+        return json.loads(zlib.decompress(self.payload).decode('utf-8'))
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create ArchivedPost instance from a post dictionary"""
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        return cls(
+            id=data.get('id'),
+            date=data.get('date'),
+            payload=zlib.compress(payload, 6)
+        )
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON import/export of posts (one JSON post per line)
+
+Usage:
+    python post_transfer.py export posts.ndjson
+    python post_transfer.py import posts.ndjson [--batch-size 1000]
+    python post_transfer.py generate 100000 > posts.ndjson
+
+Use "-" as the file name to read from stdin or write to stdout.
+"""
+
+import sys
+import os
+import json
+import uuid
+import random
+import argparse
+from datetime import datetime, timedelta
+
+from media import normalize_images
+from models import db, NewsPost, ArchivedPost, IST, DATE_FORMAT
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Maximum number of per-line errors kept in an import report
+MAX_REPORTED_ERRORS = 20
+
+def post_to_ndjson(post):
+    """Serialize a post dictionary as one NDJSON line"""
+    return json.dumps(post, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def iter_stored_posts(batch_size=DEFAULT_BATCH_SIZE, skip_ids=()):
+    """Yield every post in the NewsPost and archive tables, batch_size rows at a time"""
+    for model in (NewsPost, ArchivedPost):
+        last_id = ''
+        while True:
+            # Keyset pagination keeps memory flat regardless of table size
+            rows = (model.query
+                    .filter(model.id > last_id)
+                    .order_by(model.id)
+                    .limit(batch_size)
+                    .all())
+            if not rows:
+                break
+            for row in rows:
+                if row.id not in skip_ids:
+                    yield row.to_dict()
+            last_id = rows[-1].id
+            db.session.expunge_all()
+
+def validate_post(data, categories):
+    """Return a NewsPost insert mapping for data, or raise ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError('expected a JSON object')
+    post_id = data.get('id') or str(uuid.uuid4())
+    if not isinstance(post_id, str) or len(post_id) > 36:
+        raise ValueError('invalid id')
+    for field in ('headline', 'description', 'category', 'author'):
+        if data.get(field) is not None and not isinstance(data[field], str):
+            raise ValueError(f'{field} must be a string')
+    headline = data.get('headline') or ''
+    description = data.get('description') or ''
+    image_urls = data.get('image_urls') or []
+    if not headline and not description and not image_urls:
+        raise ValueError('post must have at least a headline, description, or image')
+    if not isinstance(image_urls, list) or not all(isinstance(url, str) for url in image_urls):
+        raise ValueError('image_urls must be a list of strings')
+    # Keep image metadata only if every image_urls entry has a well-formed one
+    images = normalize_images(data.get('images'), image_urls)
+    category = data.get('category')
+    if category and category not in categories:
+        raise ValueError(f'invalid category {category!r}')
+    date = data.get('date')
+    try:
+        post_time = datetime.strptime(date, DATE_FORMAT).replace(tzinfo=IST)
+    except (TypeError, ValueError):
+        raise ValueError(f'invalid date {date!r}')
+    if post_time > datetime.now(IST):
+        raise ValueError(f'date {date!r} is in the future')
+    return {
+        'id': post_id,
+        'headline': headline,
+        'description': description,
+        'image_urls': json.dumps(image_urls),
+        'images': json.dumps(images),
+        'date': date,
+        'category': category or None,
+        'author': data.get('author') or ''
+    }
+
+def _insert_batch(batch):
+    """Insert a batch of mappings, skipping IDs already stored. Returns the insert count."""
+    existing = {
+        row.id for row in
+        db.session.query(NewsPost.id).filter(NewsPost.id.in_(list(batch)))
+    }
+    rows = [mapping for post_id, mapping in batch.items() if post_id not in existing]
+    if rows:
+        db.session.bulk_insert_mappings(NewsPost, rows)
+    db.session.commit()
+    db.session.expunge_all()
+    return len(rows)
+
+def import_posts(lines, categories, batch_size=DEFAULT_BATCH_SIZE):
+    """Bulk insert NDJSON post lines into NewsPost at constant memory.
+
+    Lines are validated against categories and inserted batch_size at a
+    time. Posts whose ID is already stored, or appeared earlier in the
+    same batch, are skipped so the first occurrence wins. Returns a report
+    dictionary with imported/skipped/invalid counts and the first errors.
+    Running servers load imported posts into the live feed on restart.
+    """
+    report = {'imported': 0, 'skipped': 0, 'invalid': 0, 'errors': []}
+    batch = {}
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            mapping = validate_post(json.loads(line), categories)
+        except ValueError as e:
+            report['invalid'] += 1
+            if len(report['errors']) < MAX_REPORTED_ERRORS:
+                report['errors'].append(f'line {line_number}: {e}')
+            continue
+        # Keep the first occurrence of each ID
+        if mapping['id'] in batch:
+            report['skipped'] += 1
+            continue
+        batch[mapping['id']] = mapping
+        if len(batch) >= batch_size:
+            inserted = _insert_batch(batch)
+            report['imported'] += inserted
+            report['skipped'] += len(batch) - inserted
+            batch = {}
+    if batch:
+        inserted = _insert_batch(batch)
+        report['imported'] += inserted
+        report['skipped'] += len(batch) - inserted
+    return report
+
+def generate_posts(count, categories, seed=0):
+    """Yield count synthetic posts for seeding benchmark datasets"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield {
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'headline': f'Benchmark post {i}',
+            'description': 'Lorem ipsum dolor sit amet. ' * rng.randint(1, 20),
+            'image_urls': [],
+            'date': (start + timedelta(minutes=i)).strftime(DATE_FORMAT),
+            'category': rng.choice(categories),
+            'author': 'Benchmark'
+        }
+
+def _open(path, mode):
+    if path == '-':
+        return sys.stdout if 'w' in mode else sys.stdin
+    return open(path, mode, encoding='utf-8')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import or export posts as NDJSON')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    export_parser = subparsers.add_parser('export', help='Write all stored posts to an NDJSON file')
+    export_parser.add_argument('path')
+    import_parser = subparsers.add_parser('import', help='Bulk insert posts from an NDJSON file')
+    import_parser.add_argument('path')
+    import_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    generate_parser = subparsers.add_parser('generate', help='Write synthetic posts as NDJSON')
+    generate_parser.add_argument('count', type=int)
+    generate_parser.add_argument('--output', default='-')
+    args = parser.parse_args(argv)
+
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from app import app, POST_CATEGORIES
+
+    if args.command == 'generate':
+        out = _open(args.output, 'w')
+        for post in generate_posts(args.count, POST_CATEGORIES):
+            out.write(post_to_ndjson(post))
+        if out is not sys.stdout:
+            out.close()
+        return 0
+
+    with app.app_context():
+        if args.command == 'export':
+            out = _open(args.path, 'w')
+            count = 0
+            for post in iter_stored_posts():
+                out.write(post_to_ndjson(post))
+                count += 1
+            if out is not sys.stdout:
+                out.close()
+            print(f"✅ Exported {count} posts", file=sys.stderr)
+        else:
+            source = _open(args.path, 'r')
+            report = import_posts(source, POST_CATEGORIES, batch_size=args.batch_size)
+            if source is not sys.stdin:
+                source.close()
+            print(f"✅ Imported {report['imported']} posts "
+                  f"({report['skipped']} skipped, {report['invalid']} invalid)", file=sys.stderr)
+            for error in report['errors']:
+                print(f"   ❌ {error}", file=sys.stderr)
+            print("💡 Restart the server to load imported posts into the live feed", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,978 @@
+function scalePreviewScreens() {
+    const modalContent = document.getElementById('previewModalContent');
+    const wrap = document.getElementById('previewScaleWrap');
+    // Each preview is 250x550, with 32px gap between, so total width ~ 532px
+    const padding = 80; // for modal padding, scrollbar, etc
+    const availW = window.innerWidth - padding;
+    const availH = window.innerHeight - 180; // for modal header, etc
+    let scale = 1;
+    if (availW < 532 || availH < 550) {
+        scale = Math.min(availW / 532, availH / 550, 1);
+    }
+    wrap.style.transform = `scale(${scale})`;
+    wrap.style.transformOrigin = 'top center';
+    modalContent.style.overflow = scale < 1 ? 'auto' : 'visible';
+}
+window.addEventListener('resize', scalePreviewScreens);
+
+let allPosts = [];
+let editSelectedFiles = [];
+let postsLoading = false;
+let selectedPosts = new Set();
+
+function escapeHTML(str) {
+    return str ? str.replace(/&/g, '&amp;')
+                .replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;')
+                .replace(/'/g, '&#39;') : '';
+}
+
+function linkify(text) {
+    return text ? text.replace(/(https?:\/\/[^\s<]+)/g, '<a href="$1" target="_blank">$1</a>') : '';
+}
+
+function isEditable(postDate) {
+    // Get current time in IST
+    const now = new Date();
+    const istOptions = {
+        timeZone: 'Asia/Kolkata',
+        year: 'numeric',
+        month: '2-digit',
+        day: '2-digit',
+        hour: '2-digit',
+        minute: '2-digit',
+        second: '2-digit',
+        hour12: false
+    };
+
+    // Convert post date to IST timezone for comparison
+    const postTime = new Date(postDate + ' Asia/Kolkata');
+    const currentTime = new Date(now.toLocaleString('en-IN', istOptions));
+
+    const hoursDiff = (currentTime - postTime) / (1000 * 60 * 60);
+    return hoursDiff <= 2;
+}
+
+function getCategoryClass(category) {
+    return category ? `category-${category}` : '';
+}
+
+async function fetchPosts(showLoading = true) {
+    if (showLoading) {
+        postsLoading = true;
+        renderPosts([]);
+    }
+    const res = await fetch('/api/news/all');
+    allPosts = await res.json();
+    postsLoading = false;
+    filterPosts();
+    updateStatistics();
+}
+
+// Render the first page embedded by the server, then fetch the rest quietly
+function loadInitialFeed() {
+    const feed = JSON.parse(document.getElementById('initialFeed').textContent);
+    allPosts = feed.posts;
+    renderPosts(allPosts);
+    updateStatistics();
+    updateBulkActions();
+    if (feed.has_more) {
+        fetchPosts(false);
+    }
+}
+
+// Apply a single created, edited or deleted post without refetching the list
+function applyPostChange(post, deletedId) {
+    const id = post ? post.id : deletedId;
+    allPosts = allPosts.filter(p => p.id !== id);
+    if (post) {
+        allPosts.push(post);
+        allPosts.sort((a, b) => (b.date || '').localeCompare(a.date || ''));
+    } else {
+        selectedPosts.delete(id);
+    }
+    filterPosts();
+    updateStatistics();
+}
+
+function updateStatistics() {
+    const totalPosts = allPosts.length;
+
+    // Get today's date in IST timezone
+    const now = new Date();
+    const istOptions = {
+        timeZone: 'Asia/Kolkata',
+        year: 'numeric',
+        month: '2-digit',
+        day: '2-digit'
+    };
+    const todayIST = now.toLocaleDateString('en-IN', istOptions);
+    const today = todayIST.split('/').reverse().join('-'); // Convert DD/MM/YYYY to YYYY-MM-DD
+
+    const todayPosts = allPosts.filter(post => post.date.startsWith(today)).length;
+    const totalImages = allPosts.reduce((sum, post) => sum + (post.image_urls ? post.image_urls.length : 0), 0);
+    const activeAdmins = adminList.length;
+
+    document.getElementById('totalPosts').textContent = totalPosts;
+    document.getElementById('todayPosts').textContent = todayPosts;
+    document.getElementById('totalImages').textContent = totalImages;
+    document.getElementById('activeAdmins').textContent = activeAdmins;
+}
+
+function showAdminManagement() {
+    const modal = document.getElementById('adminModal');
+    if (modal) {
+        modal.style.display = 'block';
+        loadAdminList();
+    }
+}
+
+function closeAdminModal() {
+    const modal = document.getElementById('adminModal');
+    if (modal) {
+        modal.style.display = 'none';
+    }
+}
+
+function renderPosts(posts) {
+    const tbody = document.getElementById('postsBody');
+    tbody.innerHTML = '';
+    if (postsLoading) {
+        const tr = document.createElement('tr');
+        tr.innerHTML = `
+            <td colspan="5" style="text-align:center; padding: 40px;">
+                <div style="display: inline-block; width: 40px; height: 40px; border: 4px solid #f3f3f3; border-top: 4px solid #1976D2; border-radius: 50%; animation: spin 1s linear infinite;"></div>
+                <div style="margin-top: 16px; color: #666; font-weight: 500;">Loading posts...</div>
+            </td>`;
+        tbody.appendChild(tr);
+        return;
+    }
+    posts.forEach(post => {
+        const escapedHeadline = escapeHTML(post.headline || '');
+        const linkedHeadline = linkify(escapedHeadline);
+        const editDisabled = isEditable(post.date) ? '' : 'disabled';
+        const isSelected = selectedPosts.has(post.id);
+        const tr = document.createElement('tr');
+        tr.innerHTML = `
+            <td>
+                <input type="checkbox" class="post-checkbox" value="${post.id}"
+                       ${isSelected ? 'checked' : ''}
+                       onchange="togglePostSelection('${post.id}')"
+                       style="margin-right: 8px;">
+                ${post.date}
+            </td>
+            <td>${post.category ? `<span class="category-badge ${getCategoryClass(post.category)}">${post.category}</span>` : ''}</td>
+            <td>${linkedHeadline}</td>
+            <td>${post.author || ''}</td>
+            <td>
+                <button onclick="openEditModal('${post.id}')" ${editDisabled}>
+                    ${editDisabled ? 'Edit (2h expired)' : 'Edit'}
+                </button>
+                <button onclick="deletePost('${post.id}')" style="background:#D32F2F;margin-left:8px;">Delete</button>
+            </td>
+        `;
+        tbody.appendChild(tr);
+    });
+}
+
+function filterPosts() {
+    const searchTerm = document.getElementById('searchPosts').value.toLowerCase();
+    const categoryFilter = document.getElementById('filterCategory').value;
+    const dateFilter = document.getElementById('filterDate').value;
+
+    const filteredPosts = allPosts.filter(post => {
+        const searchMatch = !searchTerm ||
+            (post.headline && post.headline.toLowerCase().includes(searchTerm)) ||
+            (post.description && post.description.toLowerCase().includes(searchTerm)) ||
+            (post.author && post.author.toLowerCase().includes(searchTerm));
+        const categoryMatch = !categoryFilter || post.category === categoryFilter;
+        const dateMatch = !dateFilter || post.date.startsWith(dateFilter);
+        return searchMatch && categoryMatch && dateMatch;
+    });
+
+    renderPosts(filteredPosts);
+    updateBulkActions();
+}
+
+document.getElementById('searchPosts').addEventListener('input', filterPosts);
+document.getElementById('filterCategory').addEventListener('change', filterPosts);
+document.getElementById('filterDate').addEventListener('input', filterPosts);
+
+// Bulk operations event listeners
+document.getElementById('selectAllBtn').addEventListener('click', toggleSelectAll);
+document.getElementById('deleteSelectedBtn').addEventListener('click', deleteSelectedPosts);
+
+const imageInput = document.getElementById('image');
+const imagePreview = document.getElementById('imagePreview');
+let selectedFiles = [];
+
+imageInput.addEventListener('change', function(e) {
+    selectedFiles = Array.from(this.files);
+    renderImagePreview();
+});
+
+function renderImagePreview() {
+    imagePreview.innerHTML = '';
+    selectedFiles.forEach(file => {
+        const reader = new FileReader();
+        reader.onload = function(e) {
+            const img = document.createElement('img');
+            img.src = e.target.result;
+            imagePreview.appendChild(img);
+        };
+        reader.readAsDataURL(file);
+    });
+}
+
+const editImageInput = document.getElementById('editImage');
+const editImagePreview = document.getElementById('editImagePreview');
+
+editImageInput.addEventListener('change', function(e) {
+    editSelectedFiles = Array.from(this.files);
+    renderEditImagePreview();
+});
+
+function renderEditImagePreview() {
+    editImagePreview.innerHTML = '';
+    editSelectedFiles.forEach(file => {
+        const reader = new FileReader();
+        reader.onload = function(e) {
+            const img = document.createElement('img');
+            img.src = e.target.result;
+            editImagePreview.appendChild(img);
+        };
+        reader.readAsDataURL(file);
+    });
+}
+
+document.getElementById('newsForm').onsubmit = async function(e) {
+    e.preventDefault();
+    const headline = document.getElementById('headline').value;
+    const category = document.getElementById('category').value;
+    const description = document.getElementById('description').value;
+    const messageDiv = document.getElementById('message');
+    messageDiv.textContent = '';
+
+    if (!headline && !description && selectedFiles.length === 0) {
+        messageDiv.textContent = 'Please provide at least a headline, description, or image.';
+        messageDiv.className = 'error';
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('headline', headline);
+        formData.append('category', category);
+        formData.append('description', description);
+        selectedFiles.forEach(file => {
+            formData.append('images', file);
+        });
+
+        const res = await fetch('/api/news', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (res.ok) {
+            const data = await res.json();
+            messageDiv.textContent = 'News pushed successfully!';
+            messageDiv.className = 'success';
+            this.reset();
+            selectedFiles = [];
+            imagePreview.innerHTML = '';
+            applyPostChange(data.item);
+        } else {
+            const err = await res.json();
+            messageDiv.textContent = err.error || 'Error pushing news.';
+            messageDiv.className = 'error';
+        }
+    } catch (err) {
+        messageDiv.textContent = 'Network error.';
+        messageDiv.className = 'error';
+    }
+};
+
+function openEditModal(postId) {
+    const post = allPosts.find(p => p.id === postId);
+    if (!post) {
+        alert('Post not found.');
+        return;
+    }
+
+    document.getElementById('editPostId').value = post.id;
+    document.getElementById('editHeadline').value = post.headline || '';
+    document.getElementById('editCategory').value = post.category || '';
+    document.getElementById('editDescription').value = post.description || '';
+
+    editImagePreview.innerHTML = '';
+    editSelectedFiles = [];
+    // Previews only need the thumbnail variant, not the full upload
+    const previewUrls = (post.images && post.images.length > 0)
+        ? post.images.map(image => image.variants.thumbnail)
+        : (post.image_urls || []);
+    previewUrls.forEach(url => {
+        const img = document.createElement('img');
+        img.src = url;
+        editImagePreview.appendChild(img);
+    });
+
+    document.getElementById('editModal').style.display = 'flex'; // Ensure modal uses flex
+}
+
+function closeEditModal() {
+    document.getElementById('editModal').style.display = 'none';
+    document.getElementById('editForm').reset();
+    editImagePreview.innerHTML = '';
+    editSelectedFiles = [];
+    document.getElementById('editMessage').textContent = '';
+}
+
+document.getElementById('editForm').onsubmit = async function(e) {
+    e.preventDefault();
+    const postId = document.getElementById('editPostId').value;
+    const headline = document.getElementById('editHeadline').value;
+    const category = document.getElementById('editCategory').value;
+    const description = document.getElementById('editDescription').value;
+    const messageDiv = document.getElementById('editMessage');
+    messageDiv.textContent = '';
+
+    if (!headline && !description && editSelectedFiles.length === 0) {
+        messageDiv.textContent = 'Please provide at least a headline, description, or image.';
+        messageDiv.className = 'error';
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('headline', headline);
+        formData.append('category', category);
+        formData.append('description', description);
+        editSelectedFiles.forEach(file => {
+            formData.append('images', file);
+        });
+
+        const res = await fetch(`/api/news/edit/${postId}`, {
+            method: 'POST',
+            body: formData
+        });
+
+        if (res.ok) {
+            const data = await res.json();
+            messageDiv.textContent = 'Post updated successfully!';
+            messageDiv.className = 'success';
+            this.reset();
+            editSelectedFiles = [];
+            editImagePreview.innerHTML = '';
+            applyPostChange(data.item);
+            setTimeout(closeEditModal, 1000);
+        } else {
+            const err = await res.json();
+            messageDiv.textContent = err.error || 'Error updating post.';
+            messageDiv.className = 'error';
+        }
+    } catch (err) {
+        messageDiv.textContent = 'Network error.';
+        messageDiv.className = 'error';
+    }
+};
+
+async function deletePost(postId) {
+    if (!confirm('Are you sure you want to delete this post?')) return;
+    try {
+        const res = await fetch(`/api/news/delete/${postId}`, {
+            method: 'DELETE'
+        });
+        if (res.ok) {
+            applyPostChange(null, postId);
+        } else {
+            alert('Failed to delete post.');
+        }
+    } catch (err) {
+        alert('Network error.');
+    }
+}
+
+// Assign Admin functionality
+document.getElementById('assignAdminBtn').addEventListener('click', function() {
+    const form = document.getElementById('assignAdminForm');
+    form.style.display = form.style.display === 'none' ? 'block' : 'none';
+});
+
+document.getElementById('assignAdminForm').onsubmit = async function(e) {
+    e.preventDefault();
+    const empIds = parseEmpIds(document.getElementById('adminEmpId').value);
+    const messageDiv = document.getElementById('assignMessage');
+    messageDiv.textContent = '';
+
+    if (empIds.length === 0) {
+        messageDiv.textContent = 'Please enter an Employee ID.';
+        messageDiv.className = 'error';
+        return;
+    }
+
+    try {
+        const res = await fetch('/api/admin/bulk', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ action: 'assign', empIds: empIds })
+        });
+
+        if (res.ok) {
+            const data = await res.json();
+            messageDiv.textContent = summarizeBulkResults(data.results);
+            messageDiv.className = data.changed > 0 ? 'success' : 'error';
+            this.reset();
+            setTimeout(() => {
+                messageDiv.textContent = '';
+            }, 3000);
+        } else {
+            const err = await res.json();
+            messageDiv.textContent = err.error || 'Error assigning admin access.';
+            messageDiv.className = 'error';
+        }
+    } catch (err) {
+        messageDiv.textContent = 'Network error.';
+        messageDiv.className = 'error';
+    }
+};
+
+function closePreviewModal() {
+    document.getElementById('previewModal').style.display = 'none';
+}
+
+function getPreviewDate() {
+  // Get current time in India timezone (IST)
+  const now = new Date();
+
+  // Format the date in IST timezone
+  const istOptions = {
+    timeZone: 'Asia/Kolkata',
+    year: 'numeric',
+    month: '2-digit',
+    day: '2-digit',
+    hour: '2-digit',
+    minute: '2-digit',
+    hour12: false
+  };
+
+  // Use toLocaleString with explicit timezone
+  return now.toLocaleString('en-IN', istOptions);
+}
+
+// Split a comma/space separated list of employee IDs
+function parseEmpIds(value) {
+    return value.split(/[\s,;]+/).map(id => id.trim()).filter(id => id);
+}
+
+function summarizeBulkResults(results) {
+    const labels = {
+        added: 'added',
+        already_admin: 'already admin',
+        not_found: 'not found',
+        invalid: 'invalid',
+        removed: 'removed',
+        not_admin: 'not an admin',
+        cannot_remove_self: 'cannot remove yourself'
+    };
+    return results.map(r => `${r.empId}: ${labels[r.status] || r.status}`).join(', ');
+}
+
+// Admin management functions
+let adminList = ['9025857', '9025676', '9023422']; // Default admin list
+let currentAdminId = document.body.dataset.employeeId || '';
+
+async function loadAdminList() {
+    try {
+        const response = await fetch('/api/admin/list');
+        if (response.ok) {
+            const data = await response.json();
+            adminList = data.admins || adminList;
+            updateAdminDisplay();
+        }
+    } catch (error) {
+        console.error('Error loading admin list:', error);
+    }
+}
+
+function updateAdminDisplay() {
+    const adminCount = document.getElementById('activeAdmins');
+    const adminListContainer = document.getElementById('adminListContainer');
+    const modalAdminCount = document.getElementById('modalAdminCount');
+
+    if (adminCount) {
+        adminCount.textContent = adminList.length;
+    }
+
+    if (modalAdminCount) {
+        modalAdminCount.textContent = adminList.length;
+    }
+
+    if (adminListContainer) {
+        adminListContainer.innerHTML = adminList.map(adminId => `
+            <div class="admin-item" data-admin-id="${adminId}">
+                <span class="admin-id">${adminId}</span>
+                ${adminId === currentAdminId ? '<span class="current-admin">(You)</span>' : ''}
+                ${adminId !== currentAdminId ? `<button class="remove-admin-btn" onclick="removeAdmin('${adminId}')">Remove</button>` : ''}
+            </div>
+        `).join('');
+    }
+}
+
+async function removeAdmin(adminId) {
+    if (!confirm(`Are you sure you want to remove admin ${adminId}?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/admin/remove', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ empId: adminId })
+        });
+
+        if (response.ok) {
+            adminList = adminList.filter(id => id !== adminId);
+            updateAdminDisplay();
+            showNotification('Admin removed successfully', 'success');
+        } else {
+            const error = await response.json();
+            showNotification(error.error || 'Failed to remove admin', 'error');
+        }
+    } catch (error) {
+        console.error('Error removing admin:', error);
+        showNotification('Error removing admin', 'error');
+    }
+}
+
+async function addAdmin() {
+    const input = prompt('Enter Employee ID(s) for new admin (comma separated):');
+    if (!input) return;
+    const newAdminIds = parseEmpIds(input);
+    if (newAdminIds.length === 0) return;
+
+    try {
+        const response = await fetch('/api/admin/bulk', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ action: 'assign', empIds: newAdminIds })
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            data.results.forEach(r => {
+                if ((r.status === 'added' || r.status === 'already_admin') && !adminList.includes(r.empId)) {
+                    adminList.push(r.empId);
+                }
+            });
+            updateAdminDisplay();
+            showNotification(summarizeBulkResults(data.results), data.changed > 0 ? 'success' : 'error');
+        } else {
+            const error = await response.json();
+            showNotification(error.error || 'Failed to add admin', 'error');
+        }
+    } catch (error) {
+        console.error('Error adding admin:', error);
+        showNotification('Error adding admin', 'error');
+    }
+}
+
+function showNotification(message, type = 'info') {
+    const notification = document.createElement('div');
+    notification.className = `notification ${type}`;
+    notification.textContent = message;
+    notification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        padding: 12px 20px;
+        border-radius: 8px;
+        color: white;
+        font-weight: 600;
+        z-index: 10000;
+        animation: slideIn 0.3s ease-out;
+        ${type === 'success' ? 'background: linear-gradient(135deg, #4CAF50 0%, #388E3C 100%);' : ''}
+        ${type === 'error' ? 'background: linear-gradient(135deg, #F44336 0%, #D32F2F 100%);' : ''}
+        ${type === 'info' ? 'background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);' : ''}
+    `;
+
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.style.animation = 'slideOut 0.3s ease-in';
+        setTimeout(() => notification.remove(), 300);
+    }, 3000);
+}
+
+function renderPreview(mode) {
+  // mode: 'light' or 'dark'
+  const headline = document.getElementById('headline').value;
+  const description = document.getElementById('description').value;
+  const images = selectedFiles;
+  const date = getPreviewDate();
+  const bgColor = mode === 'light' ? '#E0F2F1' : '#1A1A1A';
+  const cardColor = mode === 'light' ? '#fff' : '#232323';
+  const headlineColor = mode === 'light' ? '#000' : '#fff';
+  const descColor = mode === 'light' ? '#222' : '#fff';
+  const dateColor = mode === 'light' ? '#333' : '#fff';
+  const bookmarkBg = mode === 'light' ? '#fff' : '#000';
+  const bookmarkIcon = mode === 'light' ? '#888' : '#fff';
+  const borderColor = mode === 'light' ? '#eee' : '#333';
+  const navitasysColor = mode === 'light' ? '#0057A7' : '#fff';
+
+  // In renderPreview, fix the preview layout:
+  // - App bar: always show menu button (left) and NAVITASYS (right).
+  // - Card: remove margin and border-radius at the top, so it attaches to the app bar.
+  // - Headline: always visible, single-line scrollable.
+  // - Tight layout, no vertical gaps.
+  // - Bookmark/date row always at the bottom.
+  //
+  // Replace the relevant section with:
+  return (() => {
+    // Dynamic heights
+    const previewHeight = 550; // px
+    let imgH = 0, headlineH = 0, descH = 0;
+    if (images.length > 0 && headline && description) {
+      imgH = Math.round(previewHeight * 0.5);
+      headlineH = Math.round(previewHeight * 0.12);
+      descH = Math.round(previewHeight * 0.18);
+    } else if (images.length > 0 && headline && !description) {
+      imgH = Math.round(previewHeight * 0.7);
+      headlineH = Math.round(previewHeight * 0.10);
+      descH = 0;
+    } else if (images.length > 0 && !headline && !description) {
+      imgH = previewHeight - 44 - 32; // appbar + bottom row
+      headlineH = 0;
+      descH = 0;
+    } else {
+      imgH = 0;
+      headlineH = headline ? Math.round(previewHeight * 0.12) : 0;
+      descH = description ? Math.round(previewHeight * 0.18) : 0;
+    }
+    return `
+      <div style="display:flex;flex-direction:column;height:100%;width:100%;background:${bgColor};">
+        <div style="height:44px;display:flex;align-items:center;justify-content:space-between;background:${mode==='light' ? '#0057A7' : '#232323'};padding:0 10px;">
+          <svg width="22" height="22" viewBox="0 0 24 24"><path fill="#fff" d="M4 6h16M4 12h16M4 18h16"/></svg>
+          <span style="font-family:'Archivo Black',sans-serif;font-size:15px;font-weight:bold;color:#fff;letter-spacing:1.2px;">NAVITASYS</span>
+        </div>
+        <div style="flex:1;display:flex;flex-direction:column;justify-content:flex-start;background:${cardColor};border-radius:0 0 18px 18px;box-shadow:0 4px 16px rgba(0,0,0,0.10);margin:0 8px 8px 8px;overflow:hidden;">
+          ${(imgH > 0) ? `<div style='width:100%;height:${imgH}px;overflow:hidden;position:relative;'><img id='previewImg${mode}0' src='' style='width:100%;height:100%;object-fit:cover;border-radius:18px 18px 0 0;background:#eee;display:block;margin:0 auto;'/><button class='preview-arrow' id='prevImg${mode}' style='position:absolute;top:50%;left:4px;transform:translateY(-50%);background:rgba(0,0,0,0.3);border:none;border-radius:50%;width:18px;height:18px;color:#fff;font-size:12px;display:none;z-index:2;'>&#8592;</button><button class='preview-arrow' id='nextImg${mode}' style='position:absolute;top:50%;right:4px;transform:translateY(-50%);background:rgba(0,0,0,0.3);border:none;border-radius:50%;width:18px;height:18px;color:#fff;font-size:12px;display:none;z-index:2;'>&#8594;</button><div id='previewDots${mode}' style='position:absolute;bottom:2px;left:0;right:0;text-align:center;'></div></div>` : ''}
+          ${(headlineH > 0) ? `<div style='height:${headlineH}px;padding:2px 8px 0 8px;display:flex;align-items:center;'><div style='width:100%;overflow-x:auto;white-space:nowrap;'><span style='font-family:Montserrat,sans-serif;font-size:13px;font-weight:bold;color:${headlineColor};letter-spacing:0.2px;line-height:1.2;display:inline-block;'>${escapeHTML(headline)}${headline.length > 50 ? ' ...' : ''}</span></div></div>` : ''}
+          ${(descH > 0) ? `<div style='height:${descH}px;overflow-y:auto;padding:0 8px 2px 8px;'><span style='font-family:Open Sans,sans-serif;font-size:11px;color:${descColor};line-height:1.4;'>${escapeHTML(description)}</span></div>` : ''}
+          <div style='flex:1;'></div>
+          <div style='display:flex;justify-content:space-between;align-items:center;padding:0 8px 6px 6px;'>
+            <div style='background:${bookmarkBg};border-radius:50%;width:15px;height:15px;display:flex;align-items:center;justify-content:center;box-shadow:0 2px 8px rgba(0,0,0,0.08);'>
+              <svg width='9' height='9' viewBox='0 0 24 24'><path fill='${bookmarkIcon}' d='M6 2a2 2 0 0 0-2 2v16.764a1 1 0 0 0 1.447.894L12 19.118l6.553 2.54A1 1 0 0 0 20 20.764V4a2 2 0 0 0-2-2H6zm0 2h12v15.382l-5.553-2.152a1 1 0 0 0-.894 0L6 19.382V4z'/></svg>
+            </div>
+            <div style='font-family:Open Sans,sans-serif;font-size:10px;color:${dateColor};'>${date}</div>
+          </div>
+        </div>
+      </div>
+    `;
+  })();
+}
+
+function renderPreviewImages(mode) {
+  // Render images in the preview carousel
+  const images = selectedFiles;
+  if (images.length === 0) return;
+  let idx = 0;
+  const imgEl = document.getElementById(`previewImg${mode}0`);
+  const prevBtn = document.getElementById(`prevImg${mode}`);
+  const nextBtn = document.getElementById(`nextImg${mode}`);
+  const dotsDiv = document.getElementById(`previewDots${mode}`);
+  function updateImg() {
+    const file = images[idx];
+    const reader = new FileReader();
+    reader.onload = function(e) {
+      imgEl.src = e.target.result;
+    };
+    reader.readAsDataURL(file);
+    prevBtn.style.display = idx > 0 ? '' : 'none';
+    nextBtn.style.display = idx < images.length - 1 ? '' : 'none';
+    // Dots
+    dotsDiv.innerHTML = '';
+    for (let i = 0; i < images.length; i++) {
+      const dot = document.createElement('span');
+      dot.style.display = 'inline-block';
+      dot.style.width = '8px';
+      dot.style.height = '8px';
+      dot.style.margin = '0 2px';
+      dot.style.borderRadius = '50%';
+      dot.style.background = i === idx ? '#fff' : '#bbb';
+      dot.style.border = '1px solid #888';
+      dot.style.cursor = 'pointer';
+      dot.onclick = () => { idx = i; updateImg(); };
+      dotsDiv.appendChild(dot);
+    }
+  }
+  prevBtn.onclick = () => { if (idx > 0) { idx--; updateImg(); } };
+  nextBtn.onclick = () => { if (idx < images.length - 1) { idx++; updateImg(); } };
+  updateImg();
+}
+
+function renderEditPreview(mode) {
+  // mode: 'light' or 'dark'
+  const headline = document.getElementById('editHeadline').value;
+  const description = document.getElementById('editDescription').value;
+  const images = editSelectedFiles;
+  const date = getPreviewDate();
+  const bgColor = mode === 'light' ? '#E0F2F1' : '#1A1A1A';
+  const cardColor = mode === 'light' ? '#fff' : '#232323';
+  const headlineColor = mode === 'light' ? '#000' : '#fff';
+  const descColor = mode === 'light' ? '#222' : '#fff';
+  const dateColor = mode === 'light' ? '#333' : '#fff';
+  const bookmarkBg = mode === 'light' ? '#fff' : '#000';
+  const bookmarkIcon = mode === 'light' ? '#888' : '#fff';
+  const borderColor = mode === 'light' ? '#eee' : '#333';
+  const navitasysColor = mode === 'light' ? '#0057A7' : '#fff';
+
+  // Get existing images from the edit preview
+  const existingImages = [];
+  const editImagePreview = document.getElementById('editImagePreview');
+  const existingImgElements = editImagePreview.querySelectorAll('img');
+  existingImgElements.forEach(img => {
+    existingImages.push(img.src);
+  });
+
+  // Combine new files with existing images
+  const allImages = [...existingImages, ...images];
+
+  // Dynamic heights
+  const previewHeight = 550; // px
+  let imgH = 0, headlineH = 0, descH = 0;
+  if (allImages.length > 0 && headline && description) {
+    imgH = Math.round(previewHeight * 0.5);
+    headlineH = Math.round(previewHeight * 0.12);
+    descH = Math.round(previewHeight * 0.18);
+  } else if (allImages.length > 0 && headline && !description) {
+    imgH = Math.round(previewHeight * 0.7);
+    headlineH = Math.round(previewHeight * 0.10);
+    descH = 0;
+  } else if (allImages.length > 0 && !headline && !description) {
+    imgH = previewHeight - 44 - 32; // appbar + bottom row
+    headlineH = 0;
+    descH = 0;
+  } else {
+    imgH = 0;
+    headlineH = headline ? Math.round(previewHeight * 0.12) : 0;
+    descH = description ? Math.round(previewHeight * 0.18) : 0;
+  }
+  return `
+    <div style="display:flex;flex-direction:column;height:100%;width:100%;background:${bgColor};">
+      <div style="height:44px;display:flex;align-items:center;justify-content:space-between;background:${mode==='light' ? '#0057A7' : '#232323'};padding:0 10px;">
+        <svg width="22" height="22" viewBox="0 0 24 24"><path fill="#fff" d="M4 6h16M4 12h16M4 18h16"/></svg>
+        <span style="font-family:'Archivo Black',sans-serif;font-size:15px;font-weight:bold;color:#fff;letter-spacing:1.2px;">NAVITASYS</span>
+      </div>
+      <div style="flex:1;display:flex;flex-direction:column;justify-content:flex-start;background:${cardColor};border-radius:0 0 18px 18px;box-shadow:0 4px 16px rgba(0,0,0,0.10);margin:0 8px 8px 8px;overflow:hidden;">
+        ${(imgH > 0) ? `<div style='width:100%;height:${imgH}px;overflow:hidden;position:relative;'><img id='previewImg${mode}0' src='' style='width:100%;height:100%;object-fit:cover;border-radius:18px 18px 0 0;background:#eee;display:block;margin:0 auto;'/><button class='preview-arrow' id='prevImg${mode}' style='position:absolute;top:50%;left:4px;transform:translateY(-50%);background:rgba(0,0,0,0.3);border:none;border-radius:50%;width:18px;height:18px;color:#fff;font-size:12px;display:none;z-index:2;'>&#8592;</button><button class='preview-arrow' id='nextImg${mode}' style='position:absolute;top:50%;right:4px;transform:translateY(-50%);background:rgba(0,0,0,0.3);border:none;border-radius:50%;width:18px;height:18px;color:#fff;font-size:12px;display:none;z-index:2;'>&#8594;</button><div id='previewDots${mode}' style='position:absolute;bottom:2px;left:0;right:0;text-align:center;'></div></div>` : ''}
+        ${(headlineH > 0) ? `<div style='height:${headlineH}px;padding:2px 8px 0 8px;display:flex;align-items:center;'><div style='width:100%;overflow-x:auto;white-space:nowrap;'><span style='font-family:Montserrat,sans-serif;font-size:13px;font-weight:bold;color:${headlineColor};letter-spacing:0.2px;line-height:1.2;display:inline-block;'>${escapeHTML(headline)}${headline.length > 50 ? ' ...' : ''}</span></div></div>` : ''}
+        ${(descH > 0) ? `<div style='height:${descH}px;overflow-y:auto;padding:0 8px 2px 8px;'><span style='font-family:Open Sans,sans-serif;font-size:11px;color:${descColor};line-height:1.4;'>${escapeHTML(description)}</span></div>` : ''}
+        <div style='flex:1;'></div>
+        <div style='display:flex;justify-content:space-between;align-items:center;padding:0 8px 6px 6px;'>
+          <div style='background:${bookmarkBg};border-radius:50%;width:15px;height:15px;display:flex;align-items:center;justify-content:center;box-shadow:0 2px 8px rgba(0,0,0,0.08);'>
+            <svg width='9' height='9' viewBox='0 0 24 24'><path fill='${bookmarkIcon}' d='M6 2a2 2 0 0 0-2 2v16.764a1 1 0 0 0 1.447.894L12 19.118l6.553 2.54A1 1 0 0 0 20 20.764V4a2 2 0 0 0-2-2H6zm0 2h12v15.382l-5.553-2.152a1 1 0 0 0-.894 0L6 19.382V4z'/></svg>
+          </div>
+          <div style='font-family:Open Sans,sans-serif;font-size:10px;color:${dateColor};'>${date}</div>
+        </div>
+      </div>
+    </div>
+  `;
+}
+
+function renderEditPreviewImages(mode) {
+  // Render images in the edit preview carousel
+  const images = editSelectedFiles;
+
+  // Get existing images from the edit preview
+  const existingImages = [];
+  const editImagePreview = document.getElementById('editImagePreview');
+  const existingImgElements = editImagePreview.querySelectorAll('img');
+  existingImgElements.forEach(img => {
+    existingImages.push(img.src);
+  });
+
+  // Combine existing images with new files
+  const allImages = [...existingImages, ...images];
+
+  if (allImages.length === 0) return;
+
+  let idx = 0;
+  const imgEl = document.getElementById(`previewImg${mode}0`);
+  const prevBtn = document.getElementById(`prevImg${mode}`);
+  const nextBtn = document.getElementById(`nextImg${mode}`);
+  const dotsDiv = document.getElementById(`previewDots${mode}`);
+
+  function updateImg() {
+    const imageSrc = allImages[idx];
+
+    // If it's a new file, use FileReader, otherwise use the existing src
+    if (idx >= existingImages.length) {
+      const file = images[idx - existingImages.length];
+      const reader = new FileReader();
+      reader.onload = function(e) {
+        imgEl.src = e.target.result;
+      };
+      reader.readAsDataURL(file);
+    } else {
+      imgEl.src = imageSrc;
+    }
+
+    prevBtn.style.display = idx > 0 ? '' : 'none';
+    nextBtn.style.display = idx < allImages.length - 1 ? '' : 'none';
+
+    // Dots
+    dotsDiv.innerHTML = '';
+    for (let i = 0; i < allImages.length; i++) {
+      const dot = document.createElement('span');
+      dot.style.display = 'inline-block';
+      dot.style.width = '8px';
+      dot.style.height = '8px';
+      dot.style.margin = '0 2px';
+      dot.style.borderRadius = '50%';
+      dot.style.background = i === idx ? '#fff' : '#bbb';
+      dot.style.border = '1px solid #888';
+      dot.style.cursor = 'pointer';
+      dot.onclick = () => { idx = i; updateImg(); };
+      dotsDiv.appendChild(dot);
+    }
+  }
+
+  prevBtn.onclick = () => { if (idx > 0) { idx--; updateImg(); } };
+  nextBtn.onclick = () => { if (idx < allImages.length - 1) { idx++; updateImg(); } };
+  updateImg();
+}
+
+document.getElementById('showPreviewBtn').onclick = function() {
+  // Render previews
+  document.getElementById('previewLight').innerHTML = renderPreview('light');
+  document.getElementById('previewDark').innerHTML = renderPreview('dark');
+  setTimeout(() => {
+    renderPreviewImages('light');
+    renderPreviewImages('dark');
+    scalePreviewScreens();
+  }, 50);
+  document.getElementById('previewModal').style.display = 'flex';
+};
+
+document.getElementById('editShowPreviewBtn').onclick = function() {
+  // Render edit previews
+  document.getElementById('previewLight').innerHTML = renderEditPreview('light');
+  document.getElementById('previewDark').innerHTML = renderEditPreview('dark');
+  setTimeout(() => {
+    renderEditPreviewImages('light');
+    renderEditPreviewImages('dark');
+    scalePreviewScreens();
+  }, 50);
+  document.getElementById('previewModal').style.display = 'flex';
+};
+
+loadInitialFeed();
+loadAdminList(); // Load admin list on page load
+
+// Bulk operations functions
+function toggleSelectAll() {
+    const selectAllBtn = document.getElementById('selectAllBtn');
+    const deleteSelectedBtn = document.getElementById('deleteSelectedBtn');
+    const selectedCount = document.getElementById('selectedCount');
+
+    if (selectedPosts.size === allPosts.length) {
+        // Deselect all
+        selectedPosts.clear();
+        selectAllBtn.textContent = '📋 Select All';
+        deleteSelectedBtn.style.display = 'none';
+        selectedCount.textContent = '';
+    } else {
+        // Select all
+        allPosts.forEach(post => selectedPosts.add(post.id));
+        selectAllBtn.textContent = '☐ Deselect All';
+        deleteSelectedBtn.style.display = 'inline-block';
+        selectedCount.textContent = `${selectedPosts.size} posts selected`;
+    }
+
+    // Update checkboxes if they exist
+    updateCheckboxes();
+}
+
+function updateCheckboxes() {
+    const checkboxes = document.querySelectorAll('.post-checkbox');
+    checkboxes.forEach(checkbox => {
+        checkbox.checked = selectedPosts.has(checkbox.value);
+    });
+}
+
+function togglePostSelection(postId) {
+    if (selectedPosts.has(postId)) {
+        selectedPosts.delete(postId);
+    } else {
+        selectedPosts.add(postId);
+    }
+
+    updateBulkActions();
+}
+
+function updateBulkActions() {
+    const selectAllBtn = document.getElementById('selectAllBtn');
+    const deleteSelectedBtn = document.getElementById('deleteSelectedBtn');
+    const selectedCount = document.getElementById('selectedCount');
+
+    if (selectedPosts.size === 0) {
+        selectAllBtn.textContent = '📋 Select All';
+        deleteSelectedBtn.style.display = 'none';
+        selectedCount.textContent = '';
+    } else if (selectedPosts.size === allPosts.length) {
+        selectAllBtn.textContent = '☐ Deselect All';
+        deleteSelectedBtn.style.display = 'inline-block';
+        selectedCount.textContent = `${selectedPosts.size} posts selected`;
+    } else {
+        selectAllBtn.textContent = '📋 Select All';
+        deleteSelectedBtn.style.display = 'inline-block';
+        selectedCount.textContent = `${selectedPosts.size} posts selected`;
+    }
+}
+
+async function deleteSelectedPosts() {
+    if (selectedPosts.size === 0) {
+        alert('No posts selected for deletion.');
+        return;
+    }
+
+    if (!confirm(`Are you sure you want to delete ${selectedPosts.size} selected posts? This action cannot be undone.`)) {
+        return;
+    }
+
+    try {
+        const postIds = Array.from(selectedPosts);
+        const deletePromises = postIds.map(postId =>
+            fetch(`/api/news/delete/${postId}`, {
+                method: 'DELETE'
+            })
+        );
+
+        const results = await Promise.all(deletePromises);
+        const failedDeletions = results.filter(result => !result.ok);
+
+        // Drop the posts that were deleted, keeping failed ones selected
+        results.forEach((result, i) => {
+            if (result.ok) {
+                applyPostChange(null, postIds[i]);
+            }
+        });
+        updateBulkActions();
+
+        if (failedDeletions.length > 0) {
+            alert(`Failed to delete ${failedDeletions.length} posts. Please try again.`);
+        } else {
+            alert(`Successfully deleted ${postIds.length} posts.`);
+        }
+    } catch (error) {
+        console.error('Error deleting posts:', error);
+        alert('An error occurred while deleting posts. Please try again.');
+    }
+}
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the database-backed admin registry and its per-worker cache
+"""
+
+from sqlalchemy import text
+
+import app as inbrief
+from models import db, AdminUser
+from conftest import ADMIN_ID
+
+def insert_admin_elsewhere(emp_id):
+    """Insert an admin on a separate connection, as another worker would"""
+    with db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO admin_users (emp_id, added_by) VALUES (:emp_id, 'other')"),
+                     {'emp_id': emp_id})
+        conn.execute(text("UPDATE admin_registry_state SET version = version + 1 WHERE id = 1"))
+
+def test_other_worker_sees_version_bump(app_context):
+    # A second registry with no cache TTL stands in for another worker
+    other = inbrief.AdminRegistry(ttl=0)
+    assert not other.is_admin('1000001')
+
+    assert inbrief.admin_registry.add('1000001', added_by=ADMIN_ID)
+    assert other.is_admin('1000001')
+
+    assert inbrief.admin_registry.remove('1000001')
+    assert not other.is_admin('1000001')
+
+def test_cached_registry_waits_for_ttl(app_context):
+    cached = inbrief.AdminRegistry(ttl=3600)
+    assert not cached.is_admin('1000002')
+    inbrief.admin_registry.add('1000002')
+    # Within the TTL the cached set is trusted without a version check
+    assert not cached.is_admin('1000002')
+
+def test_login_required_logs_out_revoked_admin(client, app_context):
+    inbrief.admin_registry.add('1000003')
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+        sess['employee_id'] = '1000003'
+    assert client.get('/api/admin/list').status_code == 200
+
+    inbrief.admin_registry.remove('1000003')
+    response = client.get('/api/admin/list')
+    assert response.status_code == 302
+    with client.session_transaction() as sess:
+        assert 'logged_in' not in sess
+
+def test_add_treats_concurrent_insert_as_already_admin(app_context, monkeypatch):
+    real_add = db.session.add
+
+    def racing_add(instance):
+        # Another worker commits the same admin between the check and our insert
+        insert_admin_elsewhere(instance.emp_id)
+        real_add(instance)
+
+    monkeypatch.setattr(db.session, 'add', racing_add)
+    assert inbrief.admin_registry.add('1000004') is False
+    monkeypatch.undo()
+
+    assert inbrief.admin_registry.is_admin('1000004')
+    assert AdminUser.query.filter_by(emp_id='1000004').count() == 1
+
+def test_add_many_falls_back_on_concurrent_insert(app_context, monkeypatch):
+    real_add_all = db.session.add_all
+
+    def racing_add_all(instances):
+        insert_admin_elsewhere('1000005')
+        real_add_all(instances)
+
+    monkeypatch.setattr(db.session, 'add_all', racing_add_all)
+    added = inbrief.admin_registry.add_many(['1000005', '1000006'], added_by=ADMIN_ID)
+    monkeypatch.undo()
+
+    assert added == ['1000006']
+    assert inbrief.admin_registry.is_admin('1000005')
+    assert inbrief.admin_registry.is_admin('1000006')
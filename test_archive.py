@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the archive sweep, archive paging and deleting archived posts
+"""
+
+from datetime import datetime, timedelta
+
+import app as inbrief
+from models import db, NewsPost, ArchivedPost, PostRecord, IST, DATE_FORMAT
+
+def make_post(post_id, days_old, image_urls=()):
+    """Build a live post dated days_old days ago"""
+    date = (datetime.now(IST) - timedelta(days=days_old)).strftime(DATE_FORMAT)
+    return PostRecord.from_dict({
+        'id': post_id,
+        'headline': f'Post {post_id}',
+        'description': '',
+        'image_urls': list(image_urls),
+        'date': date,
+        'category': None,
+        'author': 'Test'
+    })
+
+def add_live_posts(*posts):
+    for post in posts:
+        inbrief.save_post(post)
+        inbrief.news_posts.append(post)
+    inbrief.invalidate_feed_snapshot()
+
+def live_ids():
+    return {post.id for post in inbrief.news_posts}
+
+def test_sweep_moves_expired_posts(app_context):
+    old = make_post('old', inbrief.POST_RETENTION_DAYS + 1)
+    recent = make_post('recent', 1)
+    add_live_posts(old, recent)
+
+    assert inbrief.archive_old_posts() == 1
+    assert live_ids() == {'recent'}
+    assert db.session.get(NewsPost, 'old') is None
+    assert db.session.get(NewsPost, 'recent') is not None
+    assert PostRecord.from_dict(db.session.get(ArchivedPost, 'old').to_dict()).to_dict() == old.to_dict()
+
+def test_sweep_keeps_posts_inserted_during_commit(app_context, monkeypatch):
+    add_live_posts(make_post('old', inbrief.POST_RETENTION_DAYS + 1), make_post('recent', 1))
+    commit = db.session.commit
+
+    def commit_with_concurrent_insert():
+        # Another request adds a post while the sweep's transaction commits
+        with inbrief._posts_lock:
+            inbrief.news_posts.insert(0, make_post('concurrent', 0))
+        commit()
+
+    monkeypatch.setattr(db.session, 'commit', commit_with_concurrent_insert)
+    assert inbrief.archive_old_posts() == 1
+    assert live_ids() == {'recent', 'concurrent'}
+
+def test_sweep_disabled_without_retention(app_context, monkeypatch):
+    monkeypatch.setattr(inbrief, 'POST_RETENTION_DAYS', 0)
+    add_live_posts(make_post('old', 365))
+    assert inbrief.archive_old_posts() == 0
+    assert live_ids() == {'old'}
+
+def test_sweep_runs_at_most_once_per_interval(app_context):
+    inbrief.maybe_archive_old_posts()
+    add_live_posts(make_post('old', inbrief.POST_RETENTION_DAYS + 1))
+    inbrief.maybe_archive_old_posts()
+    assert live_ids() == {'old'}
+
+    inbrief._last_archive_sweep = None
+    inbrief.maybe_archive_old_posts()
+    assert live_ids() == set()
+
+def test_archive_paging(client, app_context):
+    for days in range(5):
+        post = make_post(f'archived-{days}', inbrief.POST_RETENTION_DAYS + 1 + days)
+        db.session.add(ArchivedPost.from_dict(post.to_dict()))
+    db.session.commit()
+
+    pages = [client.get(f'/api/news/archive?page={page}&per_page=2').get_json() for page in (1, 2, 3)]
+    assert [[post['id'] for post in page['posts']] for page in pages] == [
+        ['archived-0', 'archived-1'], ['archived-2', 'archived-3'], ['archived-4']
+    ]
+    assert [page['has_more'] for page in pages] == [True, True, False]
+    assert pages[0]['page'] == 1 and pages[0]['per_page'] == 2
+
+    assert client.get('/api/news/archive?page=0').status_code == 400
+    assert client.get('/api/news/archive?per_page=-1').status_code == 400
+    assert client.get('/api/news/archive?image_size=huge').status_code == 400
+
+def test_archive_sweeps_before_listing(client, app_context):
+    add_live_posts(make_post('old', inbrief.POST_RETENTION_DAYS + 1))
+    data = client.get('/api/news/archive').get_json()
+    assert [post['id'] for post in data['posts']] == ['old']
+    assert data['has_more'] is False
+    assert live_ids() == set()
+
+def test_delete_archived_post(admin_client, app_context, monkeypatch):
+    destroyed = []
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', lambda public_id: destroyed.append(public_id))
+    url = 'https://res.cloudinary.com/dttnc46ds/image/upload/v1700000000/test/image/abc.jpg'
+    post = make_post('archived', inbrief.POST_RETENTION_DAYS + 1, [url])
+    db.session.add(ArchivedPost.from_dict(post.to_dict()))
+    db.session.commit()
+
+    response = admin_client.delete('/api/news/delete/archived')
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'id': 'archived'}
+    assert db.session.get(ArchivedPost, 'archived') is None
+    assert destroyed == ['test/image/abc']
+
+    assert admin_client.delete('/api/news/delete/archived').status_code == 404
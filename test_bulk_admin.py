@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk admin assign/remove with a stubbed SAP EmpJob API
+"""
+
+import re
+
+import pytest
+
+import app as inbrief
+from conftest import ADMIN_ID
+
+# Employee IDs the stubbed SAP API knows about
+SAP_EMPLOYEES = {'2000001', '2000002', '2000003', '2000004', '2000005', ADMIN_ID}
+
+class StubResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def json(self):
+        return self._payload
+
+@pytest.fixture
+def sap_calls(monkeypatch):
+    """Stub requests.get with an EmpJob lookup and record the queried IDs per call"""
+    calls = []
+
+    def fake_get(url, **kwargs):
+        queried = re.findall(r"userId eq '([^']*)'", url)
+        calls.append(queried)
+        results = [{'userId': emp_id} for emp_id in queried if emp_id in SAP_EMPLOYEES]
+        return StubResponse(200, {'d': {'results': results}})
+
+    monkeypatch.setattr(inbrief.requests, 'get', fake_get)
+    return calls
+
+def bulk(client, action, emp_ids):
+    return client.post('/api/admin/bulk', json={'action': action, 'empIds': emp_ids})
+
+def statuses(response):
+    return [(result['empId'], result['status']) for result in response.get_json()['results']]
+
+def test_assign_batches_sap_lookups(admin_client, sap_calls, monkeypatch):
+    monkeypatch.setattr(inbrief, 'SAP_LOOKUP_BATCH_SIZE', 2)
+    response = bulk(admin_client, 'assign', ['2000001', '2000002', '2000003', '2000004', '2000005'])
+
+    assert response.status_code == 200
+    assert sap_calls == [['2000001', '2000002'], ['2000003', '2000004'], ['2000005']]
+    assert response.get_json()['changed'] == 5
+    assert admin_client.get('/api/admin/list').get_json()['admins'] == sorted(
+        inbrief.ALLOWED_ADMIN_IDS | SAP_EMPLOYEES)
+
+def test_assign_reports_status_per_id(admin_client, sap_calls):
+    response = bulk(admin_client, 'assign', [
+        '2000001', ' 2000001 ', 2000002, '9999999', ADMIN_ID,
+        'not an id', 'x' * 21, None, True, 3.5, ['2000003']
+    ])
+
+    assert response.status_code == 200
+    assert statuses(response) == [
+        ('2000001', 'added'),
+        ('2000002', 'added'),
+        ('9999999', 'not_found'),
+        (ADMIN_ID, 'already_admin'),
+        ('not an id', 'invalid'),
+        ('x' * 21, 'invalid'),
+        (None, 'invalid'),
+        (True, 'invalid'),
+        (3.5, 'invalid'),
+        (['2000003'], 'invalid'),
+    ]
+    # Duplicates and invalid IDs are never sent to SAP
+    assert sap_calls == [['2000001', '2000002', '9999999', ADMIN_ID]]
+
+def test_remove_reports_status_per_id(admin_client, sap_calls):
+    bulk(admin_client, 'assign', ['2000001'])
+    response = bulk(admin_client, 'remove', ['2000001', '2000002', ADMIN_ID, '2000001'])
+
+    assert statuses(response) == [
+        ('2000001', 'removed'),
+        ('2000002', 'not_admin'),
+        (ADMIN_ID, 'cannot_remove_self'),
+    ]
+    assert '2000001' not in admin_client.get('/api/admin/list').get_json()['admins']
+
+def test_rejects_bad_requests(admin_client, sap_calls):
+    assert bulk(admin_client, 'promote', ['2000001']).status_code == 400
+    assert bulk(admin_client, 'assign', []).status_code == 400
+    assert bulk(admin_client, 'assign', '2000001').status_code == 400
+    too_many = [str(3000000 + i) for i in range(inbrief.MAX_BULK_ADMIN_IDS + 1)]
+    assert bulk(admin_client, 'assign', too_many).status_code == 400
+    assert sap_calls == []
+
+def test_sap_failure_changes_nothing(admin_client, monkeypatch):
+    monkeypatch.setattr(inbrief.requests, 'get', lambda url, **kwargs: StubResponse(503))
+    response = bulk(admin_client, 'assign', ['2000001'])
+
+    assert response.status_code == 500
+    assert '2000001' not in admin_client.get('/api/admin/list').get_json()['admins']
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the server-rendered first feed page, fingerprinted assets and the feed snapshot
+"""
+
+import re
+import json
+import hashlib
+import os
+from datetime import datetime, timedelta
+
+import app as inbrief
+from models import PostRecord, IST, DATE_FORMAT
+
+INITIAL_FEED_PATTERN = re.compile(r'<script id="initialFeed" type="application/json">(.*?)</script>', re.S)
+
+def add_posts(count):
+    """Add count live posts, post-0 being the newest"""
+    now = datetime.now(IST)
+    for i in range(count):
+        inbrief.news_posts.append(PostRecord.from_dict({
+            'id': f'post-{i}',
+            'headline': f'Post {i}',
+            'description': '',
+            'image_urls': [],
+            'date': (now - timedelta(minutes=i)).strftime(DATE_FORMAT),
+            'category': None,
+            'author': 'Test'
+        }))
+    inbrief.invalidate_feed_snapshot()
+
+def initial_feed(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    return json.loads(INITIAL_FEED_PATTERN.search(response.get_data(as_text=True)).group(1))
+
+def test_initial_feed_first_page(admin_client):
+    add_posts(inbrief.DASHBOARD_FIRST_PAGE_SIZE + 5)
+    feed = initial_feed(admin_client)
+    assert [post['id'] for post in feed['posts']] == [f'post-{i}' for i in range(inbrief.DASHBOARD_FIRST_PAGE_SIZE)]
+    assert feed['has_more'] is True
+    assert feed['posts'] == admin_client.get('/api/news/all').get_json()[:inbrief.DASHBOARD_FIRST_PAGE_SIZE]
+
+def test_initial_feed_single_page(admin_client):
+    add_posts(inbrief.DASHBOARD_FIRST_PAGE_SIZE)
+    feed = initial_feed(admin_client)
+    assert len(feed['posts']) == inbrief.DASHBOARD_FIRST_PAGE_SIZE
+    assert feed['has_more'] is False
+
+def test_initial_feed_empty(admin_client):
+    assert initial_feed(admin_client) == {'posts': [], 'has_more': False}
+
+def test_asset_url_fingerprint(monkeypatch):
+    monkeypatch.setattr(inbrief, '_asset_versions', {})
+    with open(os.path.join(inbrief.app.static_folder, 'dashboard.css'), 'rb') as f:
+        version = hashlib.md5(f.read()).hexdigest()[:12]
+    with inbrief.app.test_request_context():
+        assert inbrief.asset_url('dashboard.css') == f'/static/dashboard.css?v={version}'
+    assert inbrief._asset_versions == {'dashboard.css': version}
+
+def test_immutable_only_for_current_fingerprint(client, monkeypatch):
+    monkeypatch.setattr(inbrief, '_asset_versions', {})
+    with inbrief.app.test_request_context():
+        url = inbrief.asset_url('dashboard.js')
+    assert 'immutable' in client.get(url).headers.get('Cache-Control', '')
+    for stale_url in ('/static/dashboard.js?v=0123456789ab', '/static/dashboard.js', url.replace('dashboard.js', 'dashboard.css')):
+        assert 'immutable' not in client.get(stale_url).headers.get('Cache-Control', '')
+
+class WriteDuringBuildRecord(PostRecord):
+    """Record whose conversion invalidates the feed, as a concurrent write would"""
+    __slots__ = ()
+
+    def to_dict(self):
+        inbrief.invalidate_feed_snapshot()
+        return super().to_dict()
+
+def test_snapshot_not_cached_across_concurrent_write(app_context):
+    add_posts(2)
+    post = inbrief.news_posts[0]
+    inbrief.news_posts[0] = WriteDuringBuildRecord(**{name: getattr(post, name) for name in PostRecord.__slots__})
+    inbrief.invalidate_feed_snapshot()
+
+    # The build still returns the feed but must not cache it
+    assert [item['id'] for item in inbrief.get_feed_snapshot()] == ['post-0', 'post-1']
+    assert inbrief._feed_snapshot is None
+
+    inbrief.news_posts[0] = post
+    snapshot = inbrief.get_feed_snapshot()
+    assert inbrief.get_feed_snapshot() is snapshot
+    inbrief.invalidate_feed_snapshot()
+    assert inbrief.get_feed_snapshot() is not snapshot
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for upload-time image metadata and variant URLs, using a stubbed Cloudinary uploader
+"""
+
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as inbrief
+from media import upload_image, image_from_url, apply_image_size, IMAGE_VARIANTS
+from models import db, NewsPost, ArchivedPost, IST, DATE_FORMAT
+from post_transfer import validate_post
+
+CLOUDINARY_URL = 'https://res.cloudinary.com/dttnc46ds/image/upload/v1700000000/test/image/abc.jpg'
+
+# Malformed images values that must fall back to metadata derived from image_urls
+MALFORMED_IMAGES = [
+    ['x'],
+    [{}],
+    [{'url': CLOUDINARY_URL}],
+    [{'url': CLOUDINARY_URL, 'variants': 'card'}],
+    [{'url': CLOUDINARY_URL, 'variants': {'card': 5}}],
+    [],
+    [image_from_url(CLOUDINARY_URL)] * 2,
+    {'url': CLOUDINARY_URL},
+]
+
+class StubUploader:
+    """Stands in for cloudinary.uploader, returning a fixed upload result"""
+
+    def __init__(self):
+        self.calls = []
+
+    def upload(self, image, **options):
+        self.calls.append(options)
+        public_id = options['public_id']
+        return {
+            'public_id': public_id,
+            'version': 1700000000,
+            'format': 'jpg',
+            'resource_type': 'image',
+            'width': 4000,
+            'height': 3000,
+            'bytes': 3500000,
+            'secure_url': f"https://res.cloudinary.com/dttnc46ds/image/upload/v1700000000/{public_id}.jpg"
+        }
+
+def test_upload_image_records_metadata_and_variants():
+    uploader = StubUploader()
+    image = upload_image(io.BytesIO(b'image'), uploader=uploader)
+
+    assert len(uploader.calls) == 1
+    assert image['public_id'] == uploader.calls[0]['public_id']
+    assert (image['width'], image['height'], image['bytes'], image['format']) == (4000, 3000, 3500000, 'jpg')
+    assert image['url'].endswith(f"/v1700000000/{image['public_id']}.jpg")
+
+    variants = image['variants']
+    assert set(variants) == set(IMAGE_VARIANTS)
+    prefix = 'https://res.cloudinary.com/dttnc46ds/image/upload/'
+    suffix = f"/v1700000000/{image['public_id']}.jpg"
+    assert variants['thumbnail'] == f"{prefix}c_fill,f_auto,g_auto,h_200,q_auto,w_200{suffix}"
+    assert variants['card'] == f"{prefix}c_limit,f_auto,q_auto,w_640{suffix}"
+    assert variants['full'] == f"{prefix}c_limit,f_auto,q_auto,w_1600{suffix}"
+
+def test_feed_image_size(admin_client, monkeypatch):
+    client = admin_client
+    uploader = StubUploader()
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'upload', uploader.upload)
+
+    response = client.post('/api/news', data={
+        'headline': 'Image post',
+        'images': [(io.BytesIO(b'image'), 'photo.jpg')]
+    }, content_type='multipart/form-data')
+    assert response.status_code == 201
+    item = response.get_json()['item']
+    image = item['images'][0]
+    assert image['width'] == 4000
+
+    def feed_item(query=''):
+        posts = client.get(f'/api/news/all{query}').get_json()
+        return next(post for post in posts if post['id'] == item['id'])
+
+    # Without image_size the original uploads are served
+    assert feed_item()['image_urls'] == [image['url']]
+    for size in IMAGE_VARIANTS:
+        assert feed_item(f'?image_size={size}')['image_urls'] == [image['variants'][size]]
+    assert client.get('/api/news/all?image_size=huge').status_code == 400
+
+def make_post(images, days_old=1):
+    return {
+        'id': 'post',
+        'headline': 'Image post',
+        'description': '',
+        'image_urls': [CLOUDINARY_URL],
+        'images': images,
+        'date': (datetime.now(IST) - timedelta(days=days_old)).strftime(DATE_FORMAT),
+        'category': None,
+        'author': 'Test'
+    }
+
+@pytest.mark.parametrize('images', MALFORMED_IMAGES)
+def test_import_rebuilds_malformed_images(images):
+    mapping = validate_post(make_post(images), inbrief.POST_CATEGORIES)
+    assert json.loads(mapping['images']) == [image_from_url(CLOUDINARY_URL)]
+
+def test_import_keeps_valid_images():
+    image = dict(image_from_url(CLOUDINARY_URL), width=800, height=600)
+    mapping = validate_post(make_post([image]), inbrief.POST_CATEGORIES)
+    assert json.loads(mapping['images']) == [image]
+
+@pytest.mark.parametrize('images', MALFORMED_IMAGES)
+def test_apply_image_size_with_malformed_images(images):
+    post = apply_image_size(make_post(images), 'card')
+    assert post['image_urls'] == [image_from_url(CLOUDINARY_URL)['variants']['card']]
+
+@pytest.mark.parametrize('images', MALFORMED_IMAGES)
+def test_malformed_stored_images_serve_and_delete(admin_client, app_context, monkeypatch, images):
+    destroyed = []
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', destroyed.append)
+    # Rows written before import validation may hold any images value
+    row = NewsPost.from_dict(make_post([]))
+    row.images = json.dumps(images)
+    db.session.add(row)
+    db.session.commit()
+    inbrief.load_stored_posts()
+
+    response = admin_client.get('/api/news/all?image_size=card')
+    assert response.status_code == 200
+    assert response.get_json()[0]['image_urls'] == [image_from_url(CLOUDINARY_URL)['variants']['card']]
+    assert admin_client.delete('/api/news/delete/post').status_code == 200
+    assert destroyed == ['test/image/abc']
+
+@pytest.mark.parametrize('images', MALFORMED_IMAGES)
+def test_malformed_archived_images_serve_and_delete(admin_client, app_context, monkeypatch, images):
+    destroyed = []
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', destroyed.append)
+    db.session.add(ArchivedPost.from_dict(make_post(images, days_old=inbrief.POST_RETENTION_DAYS + 1)))
+    db.session.commit()
+
+    response = admin_client.get('/api/news/archive?image_size=card')
+    assert response.status_code == 200
+    assert response.get_json()['posts'][0]['image_urls'] == [image_from_url(CLOUDINARY_URL)['variants']['card']]
+    assert admin_client.delete('/api/news/delete/post').status_code == 200
+    assert destroyed == ['test/image/abc']
+
+def test_delete_cloudinary_images_skips_malformed_entries(monkeypatch):
+    destroyed = []
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', destroyed.append)
+    inbrief.delete_cloudinary_images(['x', None, {}, {'public_id': 5, 'url': CLOUDINARY_URL},
+                                      {'public_id': 'a', 'url': None}, image_from_url(CLOUDINARY_URL)])
+    assert destroyed == ['test/image/abc']
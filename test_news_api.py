@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the post add, edit and delete endpoints
+"""
+
+import app as inbrief
+from media import image_from_url
+from models import db, NewsPost
+
+def add_post(admin_client, headline='Headline'):
+    response = admin_client.post('/api/news', data={'headline': headline, 'description': 'Body'})
+    assert response.status_code == 201
+    return response.get_json()['item']
+
+def fail_commit():
+    raise RuntimeError('database unavailable')
+
+def test_edit_saves_before_changing_live_post(admin_client, app_context):
+    item = add_post(admin_client, 'Before')
+    response = admin_client.post(f"/api/news/edit/{item['id']}", data={'headline': 'After'})
+    assert response.status_code == 200
+    assert response.get_json()['item']['headline'] == 'After'
+    assert inbrief.news_posts[0].headline == 'After'
+    assert db.session.get(NewsPost, item['id']).headline == 'After'
+
+def test_failed_edit_leaves_live_post_intact(admin_client, app_context, monkeypatch):
+    item = add_post(admin_client, 'Before')
+    feed = admin_client.get('/api/news/all').get_json()
+    monkeypatch.setattr(db.session, 'commit', fail_commit)
+
+    response = admin_client.post(f"/api/news/edit/{item['id']}", data={'headline': 'After'})
+    assert response.status_code == 500
+    assert inbrief.news_posts[0].headline == 'Before'
+    assert admin_client.get('/api/news/all').get_json() == feed
+
+def test_delete_destroys_images_after_commit(admin_client, app_context, monkeypatch):
+    url = 'https://res.cloudinary.com/dttnc46ds/image/upload/v1700000000/test/image/abc.jpg'
+    item = add_post(admin_client)
+    post = inbrief.news_posts[0].replace(image_urls=(url,), images=(image_from_url(url),))
+    inbrief.save_post(post)
+    inbrief.replace_live_post(post)
+
+    events = []
+    commit = db.session.commit
+    monkeypatch.setattr(db.session, 'commit', lambda: (events.append('commit'), commit()))
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', lambda public_id: events.append(public_id))
+
+    response = admin_client.delete(f"/api/news/delete/{item['id']}")
+    assert response.status_code == 200
+    assert events == ['commit', 'test/image/abc']
+    assert inbrief.news_posts == []
+    assert db.session.get(NewsPost, item['id']) is None
+
+def test_failed_delete_keeps_post_and_images(admin_client, app_context, monkeypatch):
+    item = add_post(admin_client)
+    destroyed = []
+    monkeypatch.setattr(db.session, 'commit', fail_commit)
+    monkeypatch.setattr(inbrief.cloudinary.uploader, 'destroy', destroyed.append)
+
+    response = admin_client.delete(f"/api/news/delete/{item['id']}")
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'Failed to delete post'}
+    assert [post.id for post in inbrief.news_posts] == [item['id']]
+    assert destroyed == []
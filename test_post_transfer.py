@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for NDJSON post import/export
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as inbrief
+from models import db, NewsPost, ArchivedPost, PostRecord, IST, DATE_FORMAT
+from post_transfer import validate_post, import_posts, iter_stored_posts, post_to_ndjson
+
+def days_ago(days):
+    return (datetime.now(IST) - timedelta(days=days)).strftime(DATE_FORMAT)
+
+def make_post(post_id, headline='Headline', days_old=1, **fields):
+    post = {
+        'id': post_id,
+        'headline': headline,
+        'description': 'Body',
+        'image_urls': [],
+        'date': days_ago(days_old),
+        'category': 'Notice',
+        'author': 'Test'
+    }
+    post.update(fields)
+    return post
+
+def ndjson(*posts):
+    return [post_to_ndjson(post) for post in posts]
+
+@pytest.mark.parametrize('fields, error', [
+    ({'headline': 5}, 'headline must be a string'),
+    ({'headline': '', 'description': ''}, 'post must have at least'),
+    ({'image_urls': 'https://example.com/a.jpg'}, 'image_urls must be a list of strings'),
+    ({'image_urls': [1]}, 'image_urls must be a list of strings'),
+    ({'category': 'Sports'}, 'invalid category'),
+    ({'date': '2024-13-01 00:00:00'}, 'invalid date'),
+    ({'date': None}, 'invalid date'),
+    ({'date': (datetime.now(IST) + timedelta(days=1)).strftime(DATE_FORMAT)}, 'in the future'),
+    ({'id': 'x' * 37}, 'invalid id'),
+])
+def test_validate_post_rejects(fields, error):
+    with pytest.raises(ValueError, match=error):
+        validate_post(make_post('post', **fields), inbrief.POST_CATEGORIES)
+
+def test_validate_post_fills_defaults():
+    mapping = validate_post({'headline': 'Only a headline', 'date': days_ago(1)}, inbrief.POST_CATEGORIES)
+    assert len(mapping['id']) == 36
+    assert mapping['description'] == '' and mapping['author'] == ''
+    assert mapping['category'] is None
+    assert json.loads(mapping['image_urls']) == []
+
+def test_import_reports_invalid_lines(app_context):
+    lines = ndjson(make_post('good')) + ['not json\n', '\n', post_to_ndjson(make_post('bad', category='Sports'))]
+    report = import_posts(lines, inbrief.POST_CATEGORIES)
+    assert (report['imported'], report['skipped'], report['invalid']) == (1, 0, 2)
+    assert report['errors'][0].startswith('line 2:')
+    assert report['errors'][1].startswith('line 4: invalid category')
+    assert NewsPost.query.count() == 1
+
+def test_import_first_duplicate_wins(app_context):
+    lines = ndjson(make_post('dup', 'First'), make_post('dup', 'Second'), make_post('other'))
+    report = import_posts(lines, inbrief.POST_CATEGORIES, batch_size=10)
+    assert (report['imported'], report['skipped']) == (2, 1)
+    assert db.session.get(NewsPost, 'dup').headline == 'First'
+
+def test_import_skips_stored_ids(app_context):
+    inbrief.save_post(PostRecord.from_dict(make_post('stored', 'Original')))
+    lines = ndjson(make_post('stored', 'Replacement'), make_post('new-1'), make_post('new-2'))
+    # A batch size of 2 puts the stored ID and a new post in the first batch
+    report = import_posts(lines, inbrief.POST_CATEGORIES, batch_size=2)
+    assert (report['imported'], report['skipped'], report['invalid']) == (2, 1, 0)
+    assert db.session.get(NewsPost, 'stored').headline == 'Original'
+
+def test_export_import_round_trip(app_context):
+    url = 'https://res.cloudinary.com/dttnc46ds/image/upload/v1700000000/test/image/abc.jpg'
+    live = make_post('live', image_urls=[url])
+    old = make_post('old', days_old=inbrief.POST_RETENTION_DAYS + 1)
+    inbrief.save_post(PostRecord.from_dict(live))
+    db.session.add(ArchivedPost.from_dict(old))
+    db.session.commit()
+    exported = [post_to_ndjson(post) for post in iter_stored_posts()]
+    assert len(exported) == 2
+
+    NewsPost.query.delete()
+    ArchivedPost.query.delete()
+    db.session.commit()
+    report = import_posts(exported, inbrief.POST_CATEGORIES)
+    assert report == {'imported': 2, 'skipped': 0, 'invalid': 0, 'errors': []}
+
+    # Startup loading re-archives the old post and restores the live one
+    inbrief.load_stored_posts()
+    assert [post.to_dict() for post in inbrief.news_posts] == [PostRecord.from_dict(live).to_dict()]
+    assert db.session.get(ArchivedPost, 'old').to_dict()['headline'] == old['headline']
+    assert db.session.get(NewsPost, 'old') is None